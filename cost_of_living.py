@@ -21,23 +21,53 @@ Purpose:
 Imported by: dn_recommendations.py
 
 Imports:
-  Third-party (if installed): requests, bs4, pandas
-  Standard library: typing, re, time, json, pathlib
+  Third-party (if installed): requests, lxml, numpy, pandas, requests_cache (optional),
+    aiohttp (optional), tqdm (optional)
+  Standard library: typing, re, time, json, pathlib, concurrent.futures, datetime, sys,
+    asyncio, threading
 """
+import sys
 import time
+import asyncio
 import re
-from typing import Dict, List, Optional
+import threading
+from datetime import timedelta
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 import requests
+import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup
-
-# HTTP request headers used to mimic a standard desktop browser.
+import lxml.html as LH
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # Optional: on-disk HTTP cache so repeat runs skip the network entirely.
+    from requests_cache import CachedSession  # type: ignore
+except ImportError:  # pragma: no cover - plain requests fallback
+    CachedSession = None
+
+try:  # Optional: single progress bar instead of one print per city.
+    from tqdm import tqdm  # type: ignore
+except ImportError:  # pragma: no cover - per-city print fallback
+    tqdm = None
+
+try:  # Optional: asyncio fetcher (fetch_cost_of_living_async).
+    import aiohttp  # type: ignore
+except ImportError:  # pragma: no cover - threaded fetcher only
+    aiohttp = None
+
+# HTTP request headers used to mimic a standard desktop browser. Compression
+# is requested explicitly; urllib3 inflates the body and the raw bytes go
+# straight to lxml without a decoded str copy.
 HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
         "(KHTML, like Gecko) Chrome/118.0 Safari/537.36"
-    )
+    ),
+    "Accept-Encoding": "gzip, deflate",
 }
 
 # Default set of cities scraped when the module is run as a script.
@@ -69,16 +99,185 @@ URL_TPL = "https://www.numbeo.com/cost-of-living/in/{city}?displayCurrency=USD"
 # Compiled regex used to extract the first numeric token from a string.
 _NUM_RE = re.compile(r"[-+]?\d*\.?\d+")
 
+# Characters parse_price may peel off a price token ("1,234.56 $"), and the
+# only characters allowed in what remains before float() is tried directly.
+_PRICE_DECOR = " \t\n\xa0$\u20ac\u00a3\u00a5"
+_NUM_CHARS = "0123456789.+-"
+
+# Metrics scraped from each page: (result key, label keywords). Keywords are
+# stored lowercase so lookups compare directly against lowercased labels.
+_METRICS = (
+    ("rent_1br_city_center_usd", ("apartment", "1 bedroom", "city")),
+    ("utilities_basic_usd", ("utilities", "85")),
+    ("internet_60mbps_usd", ("internet", "60")),
+    ("transport_monthly_pass_usd", ("monthly", "pass")),
+    ("milk", ("milk", "1 liter")),
+    ("bread", ("bread", "500")),
+    ("rice", ("rice", "1kg")),
+    ("eggs", ("eggs", "12")),
+    ("chicken", ("chicken", "1kg")),
+    ("apples", ("apples", "1kg")),
+)
+
+
+def _build_label_matcher(metrics) -> Callable[[str], Tuple[str, ...]]:
+    """
+    Generate a matcher specialized to the fixed metric keywords.
+
+    The needle lists never change at runtime, so instead of a generic
+    `all(kw in label for kw in needles)` per metric (one generator per
+    check), the keyword tests are unrolled into plain `and`-chained `in`
+    expressions in a single function compiled once at import.
+
+    Args:
+        metrics: Sequence of (key, lowercase keywords) pairs.
+
+    Returns:
+        A function mapping a lowercased label to the tuple of metric keys
+        whose keywords all occur in it (usually empty).
+
+    Raises:
+        None.
+    """
+    lines = ["def match(label):", "    hits = ()"]
+    for key, needles in metrics:
+        cond = " and ".join(f"{kw!r} in label" for kw in needles)
+        lines.append(f"    if {cond}:")
+        lines.append(f"        hits += ({key!r},)")
+    lines.append("    return hits")
+
+    namespace: Dict[str, Callable[[str], Tuple[str, ...]]] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["match"]
+
+
+_match_label = _build_label_matcher(_METRICS)
+
+# Numbeo keeps every price in its main "data_wide_table"; restricting the row
+# scan to it skips navigation/comparison tables. The broad query is the
+# fallback should the class name ever change. Both are compiled once.
+_PRICE_ROWS = etree.XPath(
+    "//table[contains(concat(' ', normalize-space(@class), ' '), ' data_wide_table ')]"
+    "//tr[td[2]]"
+)
+_ALL_ROWS = etree.XPath("//table//tr[td[2]]")
+
+# Food basket items (keys from _METRICS) and assumed monthly quantities.
+_FOOD_BASKET = (
+    ("milk", 8),
+    ("bread", 8),
+    ("rice", 3),
+    ("eggs", 2),
+    ("chicken", 3),
+    ("apples", 4),
+)
+
+# Output columns, in the order returned by get_city_data.
+_COLUMNS = (
+    "city",
+    "rent_1br_city_center_usd",
+    "utilities_basic_usd",
+    "internet_60mbps_usd",
+    "transport_monthly_pass_usd",
+    "food_estimate_usd",
+    "source",
+)
+
+# Number of concurrent city requests. Scraping is network-bound, so threads
+# overlap the per-request latency instead of waiting on each city in turn.
+# Callers may ask for more (fetch_cost_of_living(max_workers=...)), up to the
+# session's connection pool size; beyond that threads would only queue for
+# a connection while adding load on Numbeo.
+_MAX_WORKERS = 8
+_POOL_SIZE = 16
+
+# Retry policy mounted on the shared session: transient server errors are
+# retried with exponential backoff (0.5s, 1s, 2s). HTTP 429 is deliberately not
+# retried here: the first one is returned at once so _download can report its
+# Retry-After and the engine's rate-limit cooldown takes over. Retry-After is
+# also ignored on 5xx so a large server value cannot stall a pool worker.
+# raise_on_status=False hands the last response back so callers still see
+# e.g. "HTTP 503" in the error metadata.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=[500, 502, 503, 504],
+    allowed_methods=["GET"],
+    respect_retry_after_header=False,
+    raise_on_status=False,
+)
+
+# SQLite file (in the project folder) backing the optional HTTP cache. Numbeo
+# prices change at most daily, so pages are reused for 24 hours.
+HTTP_CACHE_NAME = str(Path.cwd() / "numbeo_cache")
+HTTP_CACHE_TTL = timedelta(hours=24)
+
+# In-process memo of successful get_city_data results, keyed by city. Failed
+# scrapes are never stored, so a later call can still recover them.
+_CITY_CACHE: Dict[str, Dict[str, Optional[float]]] = {}
+_CITY_CACHE_LOCK = threading.Lock()
+
+# Shared keep-alive session for all Numbeo requests. The adapter's connection
+# pool is thread-safe and sized for the worker pool, so TCP/TLS handshakes are
+# amortized across every city fetched in a run. When requests-cache is
+# installed, successful pages are also cached on disk.
+if CachedSession is not None:
+    _SESSION = CachedSession(
+        HTTP_CACHE_NAME,
+        backend="sqlite",
+        expire_after=HTTP_CACHE_TTL,
+        allowable_codes=[200],
+    )
+else:
+    _SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE, max_retries=_RETRY),
+)
+
 
 # --------------------------------------------------------------------------- #
 # Helpers
 # --------------------------------------------------------------------------- #
+def clear_http_cache() -> None:
+    """
+    Drop every cached Numbeo page so the next scrape hits the network.
+
+    A no-op when requests-cache is not installed.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+    cache = getattr(_SESSION, "cache", None)
+    if cache is not None:
+        cache.clear()
+
+
+def clear_city_cache() -> None:
+    """
+    Forget the in-process results memoized by `get_city_data`.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+    with _CITY_CACHE_LOCK:
+        _CITY_CACHE.clear()
+
+
 def parse_price(s: str) -> Optional[float]:
     """
     Extract the first numeric token from a price string and return it as float.
 
     Handles common thousands separators (e.g., commas) and gracefully returns
-    None when parsing fails.
+    None when parsing fails. Plain prices are converted with float() directly;
+    anything else falls back to the regex scan.
 
     Args:
         s: Raw text containing a price (e.g., "$1,234.56").
@@ -93,8 +292,25 @@ def parse_price(s: str) -> Optional[float]:
     if not s:
         return None
 
-    # Remove common thousands separators before regex extraction.
+    # Remove common thousands separators before extraction.
     s = s.replace(",", "")
+
+    # Fast path: peel currency symbols/whitespace and float() the leading
+    # token when it is purely numeric, either the whole string ("1234.56 $")
+    # or its first word ("1234.56 per month"). The character check keeps
+    # float() from accepting "1e5", "nan", "1_0"; anything else ("1.2.3",
+    # "approx.5") is left to the regex.
+    token = s.strip(_PRICE_DECOR)
+    junk = token.strip(_NUM_CHARS)
+    if junk:
+        token = token.split(None, 1)[0].rstrip(_PRICE_DECOR)
+        junk = token.strip(_NUM_CHARS)
+    if token and not junk:
+        try:
+            return float(token)
+        except ValueError:
+            pass
+
     match = _NUM_RE.search(s)
     if not match:
         return None
@@ -106,16 +322,74 @@ def parse_price(s: str) -> Optional[float]:
         return None
 
 
-def find_row_value(soup: BeautifulSoup, needles: List[str]) -> Optional[float]:
+def _price_rows(tree: LH.HtmlElement) -> list:
+    """
+    Return the two-cell rows of the page's price table, in document order.
+
+    Falls back to every two-cell row on the page when no `data_wide_table`
+    is present.
+
+    Args:
+        tree: Parsed lxml.html tree of a Numbeo cost-of-living page.
+
+    Returns:
+        A list of <tr> elements.
+
+    Raises:
+        None.
+    """
+    return _PRICE_ROWS(tree) or _ALL_ROWS(tree)
+
+
+def _extract_metrics(tree: LH.HtmlElement) -> Dict[str, Optional[float]]:
+    """
+    Resolve every metric in `_METRICS` in one pass over the page rows.
+
+    Rows are visited in document order; each metric takes the first row whose
+    label contains all its keywords and whose value parses. The scan stops as
+    soon as every metric is resolved, and a row's value text is only read
+    when `_match_label` says its label matches something.
+
+    Args:
+        tree: Parsed lxml.html tree of a Numbeo cost-of-living page.
+
+    Returns:
+        A mapping of metric key to parsed value (None when not found).
+
+    Raises:
+        None.
+    """
+    found: Dict[str, Optional[float]] = dict.fromkeys(key for key, _ in _METRICS)
+    remaining = set(found)
+
+    for tr in _price_rows(tree):
+        hits = _match_label(tr.xpath("normalize-space(td[1])").lower())
+        if not hits:
+            continue
+        value = parse_price(tr.xpath("normalize-space(td[2])"))
+        if value is None:
+            continue
+        for key in hits:
+            if key in remaining:
+                found[key] = value
+                remaining.discard(key)
+        if not remaining:
+            break
+
+    return found
+
+
+def find_row_value(tree: LH.HtmlElement, needles: List[str]) -> Optional[float]:
     """
     Locate a table row whose first cell contains all given keywords, and
     parse the numeric value from the second cell.
 
     The function scans table rows on the Numbeo page, matching on a
-    case-insensitive label in the leftmost column.
+    case-insensitive label in the leftmost column. For the fixed metric set,
+    `_extract_metrics` resolves everything in a single pass instead.
 
     Args:
-        soup: Parsed BeautifulSoup HTML of a Numbeo cost-of-living page.
+        tree: Parsed lxml.html tree of a Numbeo cost-of-living page.
         needles: Keywords that must all appear in the left cell text.
                  Example: ["apartment", "1 bedroom", "city"]
 
@@ -125,32 +399,141 @@ def find_row_value(soup: BeautifulSoup, needles: List[str]) -> Optional[float]:
     Raises:
         None.
     """
-    # Iterate all table rows; Numbeo pages contain several tables.
-    for tr in soup.select("table tr"):
-        tds = tr.find_all("td")
-        if len(tds) < 2:
-            continue
-
+    needles = [kw.lower() for kw in needles]
+    for tr in _price_rows(tree):
         # Normalize label text for robust substring matching.
-        label = (tds[0].get_text(strip=True) or "").lower()
+        label = tr.xpath("normalize-space(td[1])").lower()
 
         # Require all keywords to appear in the label.
-        if all(kw.lower() in label for kw in needles):
-            value_text = tds[1].get_text(strip=True)
-            value = parse_price(value_text)
+        if all(kw in label for kw in needles):
+            value = parse_price(tr.xpath("normalize-space(td[2])"))
             if value is not None:
                 return value
 
     return None
 
 
-def get_city_data(city: str, sleep: float = 0.8, retries: int = 3) -> Dict[str, Optional[float]]:
+def parse_page(content: bytes, city: str, source: str) -> Dict[str, Optional[float]]:
+    """
+    Extract the tracked metrics from a downloaded Numbeo city page.
+
+    Pure CPU work with no I/O, shared by the threaded and asyncio fetchers.
+
+    Args:
+        content: Raw HTML bytes of the city page.
+        city: City name the page belongs to.
+        source: URL recorded in the `source` column.
+
+    Returns:
+        A dictionary with the keys documented in `get_city_data`.
+
+    Raises:
+        lxml.etree.ParserError: If `content` is empty or not HTML.
+    """
+    tree = LH.fromstring(content)
+
+    # Single pass over the rows; lookups rely on keywords in the left cell.
+    found = _extract_metrics(tree)
+
+    # ------------------------------------------------------------------
+    # Heuristic "food basket" estimate:
+    # - Pairs item price with an assumed monthly quantity.
+    # - Uses only items that were successfully parsed.
+    # - If at least 3 items are available, scale subtotal to a 6-item
+    #   basket by multiplying by (6 / used), then round to cents.
+    #   This preserves the original behavior while smoothing sparsity.
+    # ------------------------------------------------------------------
+    food: Optional[float] = None
+
+    used = 0
+    subtotal = 0.0
+    for item, qty in _FOOD_BASKET:
+        price = found[item]
+        if isinstance(price, (int, float)):
+            used += 1
+            subtotal += price * qty
+
+    if used >= 3:
+        food = round(subtotal * (6 / used), 2)
+
+    return dict(
+        city=city,
+        rent_1br_city_center_usd=found["rent_1br_city_center_usd"],
+        utilities_basic_usd=found["utilities_basic_usd"],
+        internet_60mbps_usd=found["internet_60mbps_usd"],
+        transport_monthly_pass_usd=found["transport_monthly_pass_usd"],
+        food_estimate_usd=food,
+        source=source,
+    )
+
+
+def _error_row(city: str, url: str, err: str) -> Dict[str, Optional[float]]:
+    """Structured failure row: all metrics None, error context in `source`."""
+    return dict(
+        city=city,
+        rent_1br_city_center_usd=None,
+        utilities_basic_usd=None,
+        internet_60mbps_usd=None,
+        transport_monthly_pass_usd=None,
+        food_estimate_usd=None,
+        source=f"ERROR: {err} @ {url}",
+    )
+
+
+def _download(city: str) -> Tuple[str, Optional[bytes], str, bool]:
+    """
+    Fetch one Numbeo city page through the shared session.
+
+    Args:
+        city: City name as displayed by Numbeo.
+
+    Returns:
+        (url, content, error, from_cache): `content` is the raw body on HTTP
+        200 and None otherwise, in which case `error` describes the failure.
+
+    Raises:
+        None.
+    """
+    url = URL_TPL.format(city=city.replace(" ", "-"))
+
+    try:
+        resp = _SESSION.get(url, timeout=30)
+        if resp.status_code == 200:
+            return url, resp.content, "", bool(getattr(resp, "from_cache", False))
+
+        # Non-200 after the adapter's retries are exhausted.
+        err = f"HTTP {resp.status_code}"
+        retry_after = resp.headers.get("Retry-After")
+        if retry_after:
+            err += f" (Retry-After: {retry_after})"
+
+    except Exception as exc:
+        # Capture the exception message for diagnostics in the result.
+        err = str(exc)
+
+    return url, None, err, False
+
+
+def _remember(data: Dict[str, Optional[float]]) -> None:
+    """Store a successful row in the per-city memo."""
+    with _CITY_CACHE_LOCK:
+        _CITY_CACHE[data["city"]] = dict(data)
+
+
+def get_city_data(city: str, sleep: float = 0.0) -> Dict[str, Optional[float]]:
     """
     Scrape selected price metrics for a single city from Numbeo.
 
-    Implements simple retry logic with exponential backoff and an optional
-    fixed sleep after a successful request (to be polite to the site and to
-    avoid rate-limiting).
+    Transient server failures (HTTP 5xx) are retried with exponential backoff
+    by the shared session's urllib3 Retry policy; HTTP 429 is returned at once
+    (with its Retry-After) so the caller's rate-limit cooldown can act on it.
+    An optional fixed sleep can follow a successful network request (pages
+    served from the HTTP cache are never delayed). Safe to call from several
+    threads at once.
+
+    Successful results are memoized per city for the life of the process, so
+    repeat calls return a copy without touching the network; see
+    `clear_city_cache` (also available as `get_city_data.cache_clear`).
 
     Metrics extracted:
         - Rent (1BR apartment in city center)
@@ -161,8 +544,9 @@ def get_city_data(city: str, sleep: float = 0.8, retries: int = 3) -> Dict[str,
 
     Args:
         city: City name as displayed by Numbeo (e.g., "New York").
-        sleep: Fixed number of seconds to sleep after a successful scrape.
-        retries: Number of HTTP attempts before giving up.
+        sleep: Seconds to sleep after a successful uncached scrape. Defaults
+               to 0; pass e.g. 0.3 for extra politeness. The pool size
+               already caps concurrent connections to Numbeo.
 
     Returns:
         A dictionary with the following keys:
@@ -177,101 +561,190 @@ def get_city_data(city: str, sleep: float = 0.8, retries: int = 3) -> Dict[str,
     Raises:
         None. All network/parse errors are caught and summarized in `source`.
     """
-    url = URL_TPL.format(city=city.replace(" ", "-"))
-    last_err: Optional[str] = None
-
-    for attempt in range(retries):
+    with _CITY_CACHE_LOCK:
+        cached = _CITY_CACHE.get(city)
+    if cached is not None:
+        # Hand out a copy so callers cannot mutate the memoized row.
+        return dict(cached)
+
+    url, content, last_err, from_cache = _download(city)
+    if content is not None:
         try:
-            resp = requests.get(url, headers=HEADERS, timeout=30)
-            if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-
-                # Individual item lookups rely on keywords present in the left cell.
-                rent = find_row_value(soup, ["apartment", "1 bedroom", "city"])
-                utilities = find_row_value(soup, ["utilities", "85"])
-                internet = find_row_value(soup, ["internet", "60"])
-                transport = find_row_value(soup, ["monthly", "pass"])
-                milk = find_row_value(soup, ["milk", "1 liter"])
-                bread = find_row_value(soup, ["bread", "500"])
-                rice = find_row_value(soup, ["rice", "1kg"])
-                eggs = find_row_value(soup, ["eggs", "12"])
-                chicken = find_row_value(soup, ["chicken", "1kg"])
-                apples = find_row_value(soup, ["apples", "1kg"])
-
-                # ------------------------------------------------------------------
-                # Heuristic "food basket" estimate:
-                # - Pairs item price with an assumed monthly quantity.
-                # - Uses only items that were successfully parsed.
-                # - If at least 3 items are available, scale subtotal to a 6-item
-                #   basket by multiplying by (6 / used), then round to cents.
-                #   This preserves the original behavior while smoothing sparsity.
-                # ------------------------------------------------------------------
-                food: Optional[float] = None
-                basket_pairs = [
-                    (milk, 8),
-                    (bread, 8),
-                    (rice, 3),
-                    (eggs, 2),
-                    (chicken, 3),
-                    (apples, 4),
-                ]
-
-                used = 0
-                subtotal = 0.0
-                for price, qty in basket_pairs:
-                    if isinstance(price, (int, float)):
-                        used += 1
-                        subtotal += price * qty
-
-                if used >= 3:
-                    food = round(subtotal * (6 / used), 2)
-
-                data = dict(
-                    city=city,
-                    rent_1br_city_center_usd=rent,
-                    utilities_basic_usd=utilities,
-                    internet_60mbps_usd=internet,
-                    transport_monthly_pass_usd=transport,
-                    food_estimate_usd=food,
-                    source=url,
-                )
-
-                # Polite fixed delay after a successful request.
+            data = parse_page(content, city, url)
+        except Exception as exc:
+            last_err = str(exc)
+        else:
+            _remember(data)
+
+            # Optional politeness delay, only when the network was actually hit.
+            if sleep and not from_cache:
                 time.sleep(sleep)
-                return data
+            return data
 
-            # Non-200 responses are treated as transient errors and retried.
-            last_err = f"HTTP {resp.status_code}"
+    # On failure, return a structured error row with None values.
+    return _error_row(city, url, last_err)
 
-        except Exception as exc:
-            # Capture the last exception message for diagnostics in the result.
-            last_err = str(exc)
 
-        # Exponential backoff between attempts: 0.5, 1.0, 2.0, ...
-        time.sleep(0.5 * (2 ** attempt))
+# lru_cache-style alias for invalidating the per-city memo.
+get_city_data.cache_clear = clear_city_cache  # type: ignore[attr-defined]
 
-    # If all attempts fail, return a structured error row with None values.
-    return dict(
-        city=city,
-        rent_1br_city_center_usd=None,
-        utilities_basic_usd=None,
-        internet_60mbps_usd=None,
-        transport_monthly_pass_usd=None,
-        food_estimate_usd=None,
-        source=f"ERROR: {last_err} @ {url}",
+
+async def get_city_data_async(
+    session: "aiohttp.ClientSession", city: str
+) -> Dict[str, Optional[float]]:
+    """
+    Asyncio counterpart of `get_city_data` for an aiohttp session.
+
+    The request is not retried and bypasses the on-disk HTTP cache; parsing
+    runs inline on the event loop since one page takes only milliseconds.
+
+    Args:
+        session: Open aiohttp client session (see `fetch_cost_of_living_async`).
+        city: City name as displayed by Numbeo (e.g., "New York").
+
+    Returns:
+        A dictionary with the keys documented in `get_city_data`.
+
+    Raises:
+        None. All network/parse errors are caught and summarized in `source`.
+    """
+    url = URL_TPL.format(city=city.replace(" ", "-"))
+
+    try:
+        async with session.get(url) as resp:
+            if resp.status == 200:
+                return parse_page(await resp.read(), city, url)
+            last_err = f"HTTP {resp.status}"
+            retry_after = resp.headers.get("Retry-After")
+            if retry_after:
+                last_err += f" (Retry-After: {retry_after})"
+    except Exception as exc:
+        last_err = str(exc) or type(exc).__name__
+
+    return _error_row(city, url, last_err)
+
+
+def _use_bar() -> bool:
+    """True when tqdm is installed and there is a stderr to draw on."""
+    return tqdm is not None and sys.stderr is not None
+
+
+def _announce(city: str) -> None:
+    """Print the per-city progress line when no tqdm bar is available."""
+    if not _use_bar():
+        print(f"Scraping {city} ...")
+
+
+def _progress(futures: Iterable, total: int) -> Iterable:
+    """
+    Wrap completed futures in a tqdm bar when tqdm is installed.
+
+    tqdm throttles its terminal writes, so worker completions do not each
+    contend for stdout as the old per-city prints did.
+
+    Args:
+        futures: Iterator of completed futures (from `as_completed`).
+        total: Number of futures, for the bar length.
+
+    Returns:
+        The wrapped iterator, or `futures` unchanged without tqdm.
+
+    Raises:
+        None.
+    """
+    if not _use_bar():
+        return futures
+    return tqdm(futures, total=total, desc="Scraping Numbeo", unit="city")
+
+
+def _to_frame(cols: Dict[str, list]) -> pd.DataFrame:
+    """
+    Build the output DataFrame from column lists.
+
+    Price columns (`*_usd`) are stored as float32: values top out around a few
+    thousand dollars with cents, well within float32 precision, and the
+    narrower dtype halves their memory for downstream consumers. Missing
+    prices become NaN.
+
+    Args:
+        cols: Mapping of column name to per-city values, keyed by `_COLUMNS`.
+
+    Returns:
+        The tidy cost-of-living DataFrame.
+
+    Raises:
+        None.
+    """
+    return pd.DataFrame(
+        {
+            k: np.array(v, dtype=np.float32) if k.endswith("_usd") else v
+            for k, v in cols.items()
+        }
     )
 
 
-def fetch_cost_of_living(cities: Optional[List[str]] = None) -> pd.DataFrame:
+async def fetch_cost_of_living_async(cities: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Scrape Numbeo for many cities from a single event loop.
+
+    Every request shares one aiohttp connection pool (16 connections) and
+    is awaited together with asyncio.gather, which scales to hundreds of
+    cities without thread-pool tuning. Run it with
+    `asyncio.run(fetch_cost_of_living_async(cities))`.
+
+    Args:
+        cities: Optional list of city names. When omitted, falls back to
+                DEFAULT_CITIES.
+
+    Returns:
+        A pandas DataFrame with one row per city, in input order, and the
+        columns documented in `get_city_data`.
+
+    Raises:
+        ImportError: If aiohttp is not installed.
+    """
+    if aiohttp is None:
+        raise ImportError("fetch_cost_of_living_async requires the optional 'aiohttp' package.")
+
+    target_cities = list(cities or DEFAULT_CITIES)
+    async with aiohttp.ClientSession(
+        headers=HEADERS,
+        connector=aiohttp.TCPConnector(limit=16),
+        timeout=aiohttp.ClientTimeout(total=30),
+    ) as session:
+        results = await asyncio.gather(*(get_city_data_async(session, c) for c in target_cities))
+
+    cols: Dict[str, list] = {k: [row[k] for row in results] for k in _COLUMNS}
+    return _to_frame(cols)
+
+
+def fetch_cost_of_living(
+    cities: Optional[List[str]] = None,
+    parse_workers: int = 0,
+    max_workers: int = _MAX_WORKERS,
+) -> pd.DataFrame:
     """
     Scrape Numbeo for a list of cities and return a tidy DataFrame.
 
-    Prints basic progress to stdout as it iterates over cities, preserving the
-    original user-visible side-effect.
+    Cities are fetched concurrently on a small thread pool because the work is
+    dominated by network latency. Rows are returned in the input city order.
+    Shows a tqdm progress bar when tqdm is installed; otherwise prints a line
+    to stdout as each city is submitted, as before.
+
+    With `parse_workers > 0`, the threads only download pages and the HTML
+    bytes are parsed on a process pool, so parsing uses several cores
+    instead of contending for the GIL. This pays off for long city lists;
+    because worker processes re-import `__main__` on spawn-based platforms
+    (Windows/macOS), only enable it from an `if __name__ == "__main__":`
+    guarded script, not from the Tk app.
 
     Args:
         cities: Optional list of city names. When omitted, falls back to
                 DEFAULT_CITIES.
+        parse_workers: Number of parser processes; 0 (default) parses in
+                the fetch threads.
+        max_workers: Number of download threads. Clamped to 1..16 (the
+                session's connection pool size).
 
     Returns:
         A pandas DataFrame with one row per city and the columns documented
@@ -281,20 +754,99 @@ def fetch_cost_of_living(cities: Optional[List[str]] = None) -> pd.DataFrame:
         None.
     """
     target_cities = list(cities or DEFAULT_CITIES)
-    rows: List[Dict[str, Optional[float]]] = []
+    workers = max(1, min(max_workers, _POOL_SIZE))
 
-    for city in target_cities:
-        # Progress update mirrors the original behavior.
-        print(f"Scraping {city} ...")
-        rows.append(get_city_data(city))
+    # Column-oriented buffers: pandas takes each list as-is instead of
+    # transposing a list of row dicts and re-inferring the schema.
+    cols: Dict[str, list] = {k: [None] * len(target_cities) for k in _COLUMNS}
+
+    def place(i: int, row: Dict[str, Optional[float]]) -> None:
+        for key, value in row.items():
+            cols[key][i] = value
+
+    if parse_workers > 0:
+        _fetch_and_parse_in_processes(target_cities, parse_workers, place, workers)
+        return _to_frame(cols)
+
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        futures = {}
+        for i, city in enumerate(target_cities):
+            _announce(city)
+            futures[ex.submit(get_city_data, city)] = i
+
+        # Collect as they finish, but keep each row at its input position.
+        for fut in _progress(as_completed(futures), len(futures)):
+            place(futures[fut], fut.result())
+
+    return _to_frame(cols)
 
-    return pd.DataFrame(rows)
+
+def _fetch_and_parse_in_processes(
+    target_cities: List[str],
+    parse_workers: int,
+    place: Callable[[int, Dict[str, Optional[float]]], None],
+    fetch_workers: int = _MAX_WORKERS,
+) -> None:
+    """
+    Download pages on threads and parse them on a process pool.
+
+    Only the page bytes cross the process boundary, which keeps pickling
+    cheap. Memoized cities are placed directly without any work.
+
+    Args:
+        target_cities: Cities to scrape, in output order.
+        parse_workers: Size of the parser process pool.
+        place: Callback storing a finished row at its input position.
+        fetch_workers: Number of download threads.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+    with ThreadPoolExecutor(max_workers=fetch_workers) as ex, ProcessPoolExecutor(
+        max_workers=parse_workers
+    ) as pool:
+        downloads = {}
+        for i, city in enumerate(target_cities):
+            with _CITY_CACHE_LOCK:
+                cached = _CITY_CACHE.get(city)
+            if cached is not None:
+                place(i, dict(cached))
+                continue
+            _announce(city)
+            downloads[ex.submit(_download, city)] = i
+
+        parses = {}
+        for fut in _progress(as_completed(downloads), len(downloads)):
+            i = downloads[fut]
+            city = target_cities[i]
+            url, content, err, _ = fut.result()
+            if content is None:
+                place(i, _error_row(city, url, err))
+            else:
+                parses[pool.submit(parse_page, content, city, url)] = (i, url)
+
+        for fut in as_completed(parses):
+            i, url = parses[fut]
+            try:
+                row = fut.result()
+            except Exception as exc:
+                row = _error_row(target_cities[i], url, str(exc))
+            else:
+                _remember(row)
+            place(i, row)
 
 
 # --------------------------------------------------------------------------- #
 # Script entry point
 # --------------------------------------------------------------------------- #
 if __name__ == "__main__":
+    # `--no-cache` forces a fresh download instead of reusing cached pages.
+    if "--no-cache" in sys.argv[1:]:
+        clear_http_cache()
+        clear_city_cache()
     df = fetch_cost_of_living()
     # Display a small preview without the index to match the original output style.
     print(df.head().to_string(index=False))
@@ -18,15 +18,25 @@ Imported by: main.py
 
 Imports:
   Local modules: cost_of_living, internet_speed, visa_restrictions
-  Standard library: datetime, pathlib, typing, re, json
-  Third-party: pandas
+  Standard library: datetime, pathlib, typing, re, json, itertools, concurrent.futures, functools, importlib, logging, random, sys, threading, time
+  Third-party: pandas, numpy, pyarrow (optional; Parquet cache)
 """
 
 from datetime import datetime
 from pathlib import Path
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import re
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import importlib.util
+import logging
+import random
+import sys
+import threading
+import time
 
 from visa_restrictions import get_visa_data
 from cost_of_living import fetch_cost_of_living
@@ -35,11 +45,40 @@ from internet_speed import fetch_speed_data
 # -----------------------------------------------------------------------------
 # Debug / logging
 # -----------------------------------------------------------------------------
-debug = False  # flip to False to silence debug prints
+debug = False  # set to True (also at runtime) to print engine debug lines
 
-def dprint(*args, **kwargs):
-    if debug:
-        print(*args, **kwargs)
+log = logging.getLogger(__name__)
+log.setLevel(logging.WARNING)
+_DEBUG_HANDLER = logging.StreamHandler(sys.stdout)
+_DEBUG_HANDLER.setFormatter(logging.Formatter("%(message)s"))
+
+def _debug_on() -> bool:
+    """
+    True when debug lines will be emitted; guard expensive dprint args with it.
+    Reads `debug` on every call, attaching or detaching the stdout handler
+    (and DEBUG level) when the flag has changed since the last call.
+    """
+    if debug != (_DEBUG_HANDLER in log.handlers):
+        if debug:
+            log.addHandler(_DEBUG_HANDLER)
+            log.setLevel(logging.DEBUG)
+        else:
+            log.removeHandler(_DEBUG_HANDLER)
+            log.setLevel(logging.WARNING)
+    return debug
+
+def dprint(*args, sep: str = " "):
+    """print()-style debug line routed through `log`; a no-op unless `debug` is on."""
+    if _debug_on():
+        log.debug("%s", sep.join(map(str, args)))
+
+# -----------------------------------------------------------------------------
+# Copy-on-write: the shared combined dataset and the Data Explorer tables are
+# handed out without defensive copies. pandas 3 always behaves this way; on
+# 2.x opt in so a caller editing its frame never writes through to ours.
+# -----------------------------------------------------------------------------
+if int(pd.__version__.split(".", 1)[0]) < 3:
+    pd.options.mode.copy_on_write = True
 
 # -----------------------------------------------------------------------------
 # Custom exceptions for COLI fetch issues (main.py shows user-friendly messages)
@@ -51,6 +90,43 @@ class CostOfLivingRateLimitError(Exception):
 class CostOfLivingFetchError(Exception):
     """Raised when cost-of-living data cannot be fetched for other HTTP reasons."""
 
+# After an HTTP 429 the engine refuses to re-scrape until a cooldown expires,
+# so repeated clicks do not keep hitting the source. The cooldown doubles per
+# consecutive 429 (with jitter) up to a cap, and never undercuts Retry-After.
+_COOLDOWN_BASE_S = 30.0
+_COOLDOWN_CAP_S = 900.0
+_COOLDOWN_UNTIL: Optional[float] = None
+_RATE_LIMIT_STRIKES = 0
+_RETRY_AFTER_RE = re.compile(r"Retry-After:\s*(\d+)")
+
+def _check_rate_limit_cooldown() -> None:
+    """Raise CostOfLivingRateLimitError while a previous 429 cooldown is running."""
+    if _COOLDOWN_UNTIL is not None:
+        remaining = _COOLDOWN_UNTIL - time.time()
+        if remaining > 0:
+            raise CostOfLivingRateLimitError(
+                f"Still cooling down after HTTP 429; retry in about {int(remaining) + 1} s."
+            )
+
+def _start_rate_limit_cooldown(sources: str) -> float:
+    """Arm the cooldown after a 429 and return its length in seconds."""
+    global _COOLDOWN_UNTIL, _RATE_LIMIT_STRIKES
+    _RATE_LIMIT_STRIKES += 1
+    base = min(_COOLDOWN_CAP_S, _COOLDOWN_BASE_S * 2 ** (_RATE_LIMIT_STRIKES - 1))
+    delay = min(_COOLDOWN_CAP_S, random.uniform(base, 2 * base))
+    hints = [int(x) for x in _RETRY_AFTER_RE.findall(sources)]
+    if hints:
+        delay = max(delay, float(max(hints)))
+    _COOLDOWN_UNTIL = time.time() + delay
+    dprint(f"[rate-limit] strike {_RATE_LIMIT_STRIKES}; cooling down {delay:.0f} s")
+    return delay
+
+def _clear_rate_limit_cooldown() -> None:
+    """Reset the backoff after a fetch that was not rate limited."""
+    global _COOLDOWN_UNTIL, _RATE_LIMIT_STRIKES
+    _COOLDOWN_UNTIL = None
+    _RATE_LIMIT_STRIKES = 0
+
 # -----------------------------------------------------------------------------
 # Cache-only mode (toggled by UI at startup)
 # -----------------------------------------------------------------------------
@@ -65,17 +141,33 @@ def set_cache_only_mode(value: bool) -> None:
 
     When True:
       • The engine will NEVER scrape.
-      • It will first try today's cache, then fall back to the newest combined_*.csv it finds.
+      • It will first try today's cache, then fall back to the newest combined_* cache it finds.
       • If no cache is present, a NoCachedDataError is raised so the UI can explain
         how to proceed.
     """
     global CACHE_ONLY_MODE
     CACHE_ONLY_MODE = bool(value)
+    # Recommenders built under the other mode may have scraped (or refused to).
+    _cached_recommender.cache_clear()
+    _cached_recommendations.cache_clear()
+    for memo in (_cost_table, _cost_rows, _country_speed_tables, _speed_rows):
+        memo.cache_clear()
     dprint(f"[mode] CACHE_ONLY_MODE={CACHE_ONLY_MODE}")
 
 # -----------------------------------------------------------------------------
 # Cache helpers — current working directory, one file per day
 # -----------------------------------------------------------------------------
+# Combined dataset cache format: Parquet when pyarrow is installed (binary,
+# typed, much faster to load than CSV), CSV otherwise. Both are read back, so
+# an existing CSV cache stays usable either way.
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+_CACHE_SUFFIX = ".parquet" if _HAS_PYARROW else ".csv"
+_CACHE_SUFFIXES = (".parquet", ".csv") if _HAS_PYARROW else (".csv",)
+# combined_<key>_<YYYYMMDD><suffix>; only suffixes this install can read.
+_TAG_RE = re.compile(
+    r"^combined_(?:.*_)?(\d{8})(?:%s)$" % "|".join(re.escape(x) for x in _CACHE_SUFFIXES)
+)
+
 def _cache_dir() -> Path:
     """
     Use the current working directory for cache files.
@@ -91,40 +183,36 @@ def _today_tag() -> str:
     dprint("[cache] Today tag:", tag)
     return tag
 
-def _combined_csv_path(key: str = "default") -> Path:
+def _combined_cache_path(key: str = "default", suffix: Optional[str] = None) -> Path:
     """
-    Path to the combined CSV for today. We only keep today's file around.
-    Example: combined_default_20251007.csv
+    Path to the combined cache file for today. We only keep today's file around.
+    Example: combined_default_20251007.parquet (or .csv without pyarrow)
     """
-    fp = _cache_dir() / f"combined_{key}_{_today_tag()}.csv"
-    dprint("[cache] Combined CSV path:", str(fp))
+    fp = _cache_dir() / f"combined_{key}_{_today_tag()}{suffix or _CACHE_SUFFIX}"
+    dprint("[cache] Combined cache path:", str(fp))
     return fp
 
 def _extract_tag_from_filename(path: Path) -> Optional[str]:
     """
-    Given a combined CSV filename, extract the YYYYMMDD tag.
-    Expected pattern: combined_<key>_<YYYYMMDD>.csv
+    Given a combined cache filename, extract the YYYYMMDD tag.
+    Expected pattern: combined_<key>_<YYYYMMDD>.parquet|.csv
     """
-    try:
-        name = path.name
-        if not name.startswith("combined_") or not name.endswith(".csv"):
-            return None
-        core = name[:-4]  # strip .csv
-        tag = core.rsplit("_", 1)[-1]
-        if tag.isdigit() and len(tag) == 8:
-            return tag
-        return None
-    except Exception:
-        return None
+    m = _TAG_RE.match(path.name)
+    return m.group(1) if m else None
+
+def _iter_cache_files():
+    """Yield every combined_*_* cache file (Parquet and CSV) in the cache dir."""
+    cache = _cache_dir()
+    for suffix in _CACHE_SUFFIXES:
+        yield from cache.glob(f"combined_*_*{suffix}")
 
 def _cleanup_old_caches(preserve_tag: str) -> None:
     """
-    Delete *all* combined_*.csv files in the cache directory that do not have
+    Delete *all* combined_* cache files in the cache directory that do not have
     the given `preserve_tag`. This guarantees we never keep more than one cache day.
     """
     try:
-        cache = _cache_dir()
-        for fp in cache.glob("combined_*_*.csv"):
+        for fp in _iter_cache_files():
             tag = _extract_tag_from_filename(fp)
             if tag is None:
                 continue
@@ -157,64 +245,143 @@ def _df_looks_valid(df: Optional[pd.DataFrame]) -> bool:
     dprint("[cache] Validation: DataFrame looks valid")
     return True
 
+# Parsed cache files kept in memory: path -> ((mtime_ns, size), DataFrame).
+# Repeat reads of an unchanged file skip disk I/O and parsing entirely.
+_IN_MEM_CACHE: Dict[Path, tuple[tuple[int, int], pd.DataFrame]] = {}
+_IN_MEM_CACHE_MAX = 4
+
+def _read_cache_csv(fp: Path) -> pd.DataFrame:
+    """
+    Parse a CSV cache with visa_free typed as bool. Uses the multithreaded
+    PyArrow parser when available, else the C parser on a memory-mapped file;
+    NA (blank) visa_free cells count as not visa-free.
+    """
+    typed = {"visa_free": "boolean"}
+    df = None
+    if _HAS_PYARROW:
+        try:
+            df = pd.read_csv(fp, engine="pyarrow", dtype=typed)
+        except (ImportError, TypeError, ValueError) as e:
+            dprint("[cache] PyArrow CSV parse failed; using C engine:", repr(e))
+    if df is None:
+        try:
+            df = pd.read_csv(fp, memory_map=True, engine="c", dtype=typed)
+        except (TypeError, ValueError):
+            # be forgiving about dtypes
+            df = pd.read_csv(fp)
+            if "visa_free" in df.columns:
+                try:
+                    df["visa_free"] = df["visa_free"].astype(bool)
+                    dprint("[cache] Coerced visa_free dtype to bool")
+                except Exception:
+                    pass
+            return df
+    if "visa_free" in df.columns:
+        df["visa_free"] = df["visa_free"].to_numpy(dtype=bool, na_value=False)
+    return df
+
+def _read_cache_file(fp: Path) -> pd.DataFrame:
+    """
+    Load one combined cache file. Parquet keeps dtypes as written; CSV is
+    parsed by _read_cache_csv. Memoized on (mtime, size); callers get a
+    copy because the load paths mutate the frame.
+    """
+    st = fp.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    hit = _IN_MEM_CACHE.get(fp)
+    if hit is not None and hit[0] == stamp:
+        dprint("[cache] In-memory hit for", fp.name)
+        return hit[1].copy()
+
+    if fp.suffix == ".parquet":
+        df = pd.read_parquet(fp)
+    else:
+        df = _read_cache_csv(fp)
+
+    if len(_IN_MEM_CACHE) >= _IN_MEM_CACHE_MAX and fp not in _IN_MEM_CACHE:
+        _IN_MEM_CACHE.pop(next(iter(_IN_MEM_CACHE)))  # drop the oldest entry
+    _IN_MEM_CACHE[fp] = (stamp, df)
+    return df.copy()
+
 def _try_read_today() -> Optional[pd.DataFrame]:
-    """Try reading today's combined CSV; return None if absent/invalid."""
-    fp = _combined_csv_path()
-    dprint("[cache] Attempting to read cache:", str(fp))
-    if not fp.exists():
-        dprint("[cache] No cache file for today")
-        return None
-    try:
-        df = pd.read_csv(fp)
-        dprint("[cache] Loaded cache with shape", df.shape, "and columns", list(df.columns))
-        # be forgiving about dtypes
-        if "visa_free" in df.columns:
-            try:
-                df["visa_free"] = df["visa_free"].astype(bool)
-                dprint("[cache] Coerced visa_free dtype to bool")
-            except Exception:
-                pass
-        ok = _df_looks_valid(df)
-        dprint("[cache] Cache valid?", ok)
-        return df if ok else None
-    except Exception as e:
-        dprint("[cache] Failed to read cache:", repr(e))
-        return None
+    """Try reading today's combined cache; return None if absent/invalid."""
+    # Prefer Parquet, but a CSV from earlier today (e.g. before pyarrow was
+    # installed) is still good.
+    for suffix in _CACHE_SUFFIXES:
+        fp = _combined_cache_path(suffix=suffix)
+        dprint("[cache] Attempting to read cache:", str(fp))
+        if not fp.exists():
+            continue
+        try:
+            df = _read_cache_file(fp)
+            dprint("[cache] Loaded cache with shape", df.shape, "and columns", list(df.columns))
+            ok = _df_looks_valid(df)
+            dprint("[cache] Cache valid?", ok)
+            if ok:
+                return df
+        except Exception as e:
+            dprint("[cache] Failed to read cache:", repr(e))
+    dprint("[cache] No usable cache file for today")
+    return None
+
+def _write_cache_csv(df: pd.DataFrame, fp: Path) -> None:
+    """
+    Write a CSV cache. PyArrow's C++ writer when available, else pandas
+    through a 1 MiB buffered file handle.
+    """
+    if _HAS_PYARROW:
+        try:
+            import pyarrow as pa
+            from pyarrow import csv as pacsv
+            pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), str(fp))
+            return
+        except Exception as e:
+            dprint("[cache] PyArrow CSV write failed; using pandas:", repr(e))
+    with open(fp, "w", encoding="utf-8", newline="", buffering=1 << 20) as fh:
+        df.to_csv(fh, index=False)
 
 def _try_write_today(df: pd.DataFrame) -> None:
     """
-    Write today's cache CSV and delete caches from other days.
+    Write today's cache file and delete caches from other days.
+    Parquet (zstd) when pyarrow is available, CSV otherwise.
     Never raise; UX should not be blocked by caching issues.
     """
     try:
         tag = _today_tag()
-        # First: delete caches from other days
+        # Delete caches from other days before writing today's
         _cleanup_old_caches(preserve_tag=tag)
 
-        fp = _combined_csv_path()
-        df.to_csv(fp, index=False)
+        fp = _combined_cache_path()
+        if fp.suffix == ".parquet":
+            try:
+                df.to_parquet(fp, engine="pyarrow", compression="zstd", index=False)
+            except Exception as e:
+                # e.g. a column pyarrow cannot type; keep a CSV cache instead.
+                dprint("[cache] Parquet write failed, falling back to CSV:", repr(e))
+                fp.unlink(missing_ok=True)
+                fp = _combined_cache_path(suffix=".csv")
+                _write_cache_csv(df, fp)
+        else:
+            _write_cache_csv(df, fp)
         dprint(f"[cache] Wrote cache to {fp} (shape={df.shape})")
-
-        # Second (defensive): ensure again no stale files remain
-        _cleanup_old_caches(preserve_tag=tag)
     except Exception as e:
         dprint("[cache] Failed to write cache:", repr(e))
         # swallow
 
 def _find_latest_combined_cache() -> Optional[Path]:
-    """Return the newest combined_*.csv in the cache directory, or None."""
-    cache = _cache_dir()
-    candidates: list[tuple[str, Path]] = []
-    for fp in cache.glob("combined_*_*.csv"):
+    """Return the newest combined cache file in the cache directory, or None."""
+    candidates: list[tuple[str, bool, Path]] = []
+    for fp in _iter_cache_files():
         tag = _extract_tag_from_filename(fp)
         if tag:
-            candidates.append((tag, fp))
+            # Same day in both formats -> the Parquet file sorts first.
+            candidates.append((tag, fp.suffix == ".parquet", fp))
     if not candidates:
-        dprint("[cache] No combined_*_*.csv files found")
+        dprint("[cache] No combined_*_* cache files found")
         return None
-    candidates.sort(key=lambda t: t[0], reverse=True)  # newest tag first
-    dprint(f"[cache] Latest cache on disk: {candidates[0][1].name}")
-    return candidates[0][1]
+    candidates.sort(key=lambda t: (t[0], t[1]), reverse=True)  # newest tag first
+    dprint(f"[cache] Latest cache on disk: {candidates[0][2].name}")
+    return candidates[0][2]
 
 def _try_read_latest_any_day() -> tuple[Optional[pd.DataFrame], Optional[str]]:
     """
@@ -225,12 +392,7 @@ def _try_read_latest_any_day() -> tuple[Optional[pd.DataFrame], Optional[str]]:
     if not fp:
         return None, None
     try:
-        df = pd.read_csv(fp)
-        if "visa_free" in df.columns:
-            try:
-                df["visa_free"] = df["visa_free"].astype(bool)
-            except Exception:
-                pass
+        df = _read_cache_file(fp)
         if _df_looks_valid(df):
             return df, _extract_tag_from_filename(fp)
         dprint("[cache] Latest cache failed validation")
@@ -266,6 +428,26 @@ REGION_BY_COUNTRY: Dict[str, str] = {
     # Extend as needed…
 }
 
+# Built once at import: the country map plus US spelling aliases (explicit
+# REGION_BY_COUNTRY entries win over the aliases).
+_REGION_MAP_FULL: Dict[str, str] = {
+    **dict.fromkeys(("United States", "United States of America", "USA", "U.S.", "US"), "Americas"),
+    **REGION_BY_COUNTRY,
+}
+
+# City -> country for the scraped cities; a Series so map() is one vectorized
+# index lookup (and a per-category gather when 'city' is categorical).
+_CITY_TO_COUNTRY = pd.Series({
+    'Zurich': 'Switzerland', 'Paris': 'France', 'Berlin': 'Germany',
+    'Sydney': 'Australia', 'Amsterdam': 'Netherlands', 'Seoul': 'South Korea',
+    'Dubai': 'United Arab Emirates', 'Toronto': 'Canada', 'Tokyo': 'Japan',
+    'London': 'United Kingdom', 'New York': 'United States',
+    'Hong Kong': 'Hong Kong', 'Barcelona': 'Spain',
+    'Johannesburg': 'South Africa', 'Singapore': 'Singapore',
+    'Prague': 'Czech Republic', 'Lisbon': 'Portugal',
+    'Bangkok': 'Thailand', 'Mexico City': 'Mexico'
+}, name='country')
+
 def _ensure_region_column(df: pd.DataFrame) -> pd.DataFrame:
     """Ensure a 'region' column exists and is populated from country names."""
     dprint("[region] START ensure_region_column")
@@ -273,40 +455,63 @@ def _ensure_region_column(df: pd.DataFrame) -> pd.DataFrame:
         dprint("[region] No 'country' column — skipping region enrichment")
         return df
 
-    region_map = dict(REGION_BY_COUNTRY or {})
-    for us_alias in ("United States", "United States of America", "USA", "U.S.", "US"):
-        region_map.setdefault(us_alias, "Americas")
+    # Work on plain objects; categorical columns reject new labels like "Other".
+    country = df["country"].astype(object)
+    if "region" in df.columns and isinstance(df["region"].dtype, pd.CategoricalDtype):
+        df["region"] = df["region"].astype(object)
 
     if "region" not in df.columns:
-        df["region"] = df["country"].map(region_map)
+        df["region"] = country.map(_REGION_MAP_FULL)
         dprint("[region] Created 'region' from country map")
     else:
         needs = df["region"].isna() | (df["region"].astype(str).str.strip() == "")
         if needs.any():
-            dprint("[region] Filling", int(needs.sum()), "missing/blank region values from country map")
-            df.loc[needs, "region"] = df.loc[needs, "country"].map(region_map)
+            if _debug_on():
+                dprint("[region] Filling", int(needs.sum()), "missing/blank region values from country map")
+            df.loc[needs, "region"] = country[needs].map(_REGION_MAP_FULL)
 
     before_na = int(df["region"].isna().sum())
     df["region"] = df["region"].fillna("Other").astype(str).str.strip()
     after_na = int(df["region"].isna().sum())
     dprint(f"[region] fillna Other: before_na={before_na} after_na={after_na}")
 
-    def _canon(s: str) -> str:
-        t = s.strip().casefold()
-        if "amer" in t:
-            return "Americas"
-        if "euro" in t:
-            return "Europe"
-        if "asia" in t:
-            return "Asia"
-        if "afri" in t:
-            return "Africa"
-        if "ocea" in t or "austral" in t:
-            return "Oceania"
-        return s if s else "Other"
-
-    df["region"] = df["region"].map(_canon)
-    dprint("[region] DONE ensure_region_column; unique regions:", sorted(df["region"].dropna().unique().tolist()))
+    # Canonicalize spelling variants in one vectorized pass; np.select keeps
+    # the first matching condition, so precedence is as listed.
+    region = df["region"]
+    folded = region.str.casefold()
+    conditions = [
+        folded.str.contains("amer", regex=False),
+        folded.str.contains("euro", regex=False),
+        folded.str.contains("asia", regex=False),
+        folded.str.contains("afri", regex=False),
+        folded.str.contains("ocea|austral", regex=True),
+    ]
+    choices = ["Americas", "Europe", "Asia", "Africa", "Oceania"]
+    fallback = region.where(region != "", "Other")
+    df["region"] = np.select(conditions, choices, default=fallback.to_numpy(dtype=object))
+    if _debug_on():
+        dprint("[region] DONE ensure_region_column; unique regions:", sorted(df["region"].dropna().unique().tolist()))
+    return df
+
+# Low-cardinality label columns stored as pandas categoricals.
+_CATEGORY_COLS = ("city", "country", "region")
+
+def _compact_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shrink the combined dataset in place: scraped price columns (*_usd) ->
+    float32 and the label columns -> category. Prices are whole cents, which
+    survive the round trip; derived values (monthly_cost, speeds, scores) stay
+    float64 so half-cent averages round to cents exactly as before.
+    """
+    if df is None:
+        return df
+    for col in df.columns:
+        if col in _CATEGORY_COLS:
+            df[col] = df[col].astype("category")
+        elif col.endswith("_usd") and pd.api.types.is_float_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], downcast="float")
+    if _debug_on():
+        dprint("[dtypes] compacted; memory bytes:", int(df.memory_usage(deep=True).sum()))
     return df
 
 def _apply_home_country_visa_override(df: pd.DataFrame, home_country: str = "United States") -> pd.DataFrame:
@@ -315,13 +520,48 @@ def _apply_home_country_visa_override(df: pd.DataFrame, home_country: str = "Uni
         return df
     mask = df["country"].astype(str).str.strip().isin([home_country, "United States of America", "USA", "US"])
     if mask.any():
-        before_true = int(df.loc[mask, "visa_free"].sum())
+        # visa_free is already bool from the loaders; assign without re-casting.
+        if _debug_on():
+            dprint(f"[visa-override] '{home_country}' rows={int(mask.sum())} "
+                   f"before_true={int(df.loc[mask, 'visa_free'].sum())} -> all set to visa_free=True")
         df.loc[mask, "visa_free"] = True
-        after_true = int(df.loc[mask, "visa_free"].sum())
-        dprint(f"[visa-override] '{home_country}' rows set to visa_free=True (before_true={before_true} after_true={after_true})")
     return df
 
 
+def _country_lookup(speed_df: Optional[pd.DataFrame], col: str) -> Dict[str, float]:
+    """
+    {Country: speed} from a speed table indexed (or keyed) by 'Country'.
+    The first row wins for duplicate countries; empty/missing tables give {}.
+    """
+    if speed_df is None or speed_df.empty:
+        return {}
+    flat = speed_df.reset_index()
+    if 'Country' not in flat.columns or col not in flat.columns:
+        return {}
+    flat = flat.drop_duplicates('Country')
+    return dict(zip(flat['Country'], pd.to_numeric(flat[col], errors='coerce')))
+
+
+def _top_n_positions(scores: np.ndarray, n: int) -> np.ndarray:
+    """
+    Positions of the n highest scores, best first; same order as
+    DataFrame.nlargest(keep='first') (ties by position, NaN last) but using
+    an O(N) argpartition plus a sort of only the selected rows.
+    """
+    keys = np.asarray(scores, dtype=np.float64)
+    keys = np.where(np.isnan(keys), -np.inf, keys)
+    k = min(int(n), keys.size)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    picked = np.argpartition(-keys, k - 1)[:k]
+    # argpartition is arbitrary among ties at the cut-off; keep the earliest.
+    cutoff = keys[picked].min()
+    above = np.flatnonzero(keys > cutoff)
+    ties = np.flatnonzero(keys == cutoff)[:k - above.size]
+    idx = np.concatenate([above, ties])
+    return idx[np.argsort(-keys[idx], kind="stable")]
+
+
 # -----------------------------------------------------------------------------
 # Core recommender
 # -----------------------------------------------------------------------------
@@ -340,13 +580,16 @@ class DigitalNomadRecommender:
         self.speed_fixed_df: Optional[pd.DataFrame] = None
         self.combined_data: Optional[pd.DataFrame] = None
         self._cache_tag: Optional[str] = None  # which YYYYMMDD the in-memory data belongs to
+        # Visa-free country set derived from visa_dict, and the dict it came from
+        self._visa_free_countries: frozenset = frozenset()
+        self._visa_free_source: Optional[Dict[str, List[str]]] = None
 
     # --------------------- cache-or-scrape orchestrator ---------------------
     def ensure_daily_dataset(self, cities: Optional[List[str]] = None) -> pd.DataFrame:
         """
-        If today's combined CSV exists and looks valid -> load and return it.
+        If today's combined cache exists and looks valid -> load and return it.
         Otherwise:
-        • When CACHE_ONLY_MODE is False -> scrape now, merge, score, write today's CSV.
+        • When CACHE_ONLY_MODE is False -> scrape now, merge, score, write today's cache.
         • When CACHE_ONLY_MODE is True  -> NEVER scrape. Try latest cache on disk (any day).
             If none exists, raise NoCachedDataError so the UI can guide the user.
         """
@@ -355,14 +598,8 @@ class DigitalNomadRecommender:
         # 1) Try today's cache first (works for both modes)
         cached = _try_read_today()
         if cached is not None:
-            cached = _ensure_region_column(cached)
-            cached = _apply_home_country_visa_override(cached)
-            self.combined_data = cached
-            if "nomad_score" not in self.combined_data.columns:
-                self.calculate_nomad_score()
             dprint("[ensure_daily_dataset] Using today's cached dataset")
-            self._cache_tag = _today_tag()
-            return self.combined_data
+            return self._adopt_cached(cached, _today_tag())
 
         # 2) If cache-only mode is on, fall back to *any* latest cache and never scrape
         if CACHE_ONLY_MODE:
@@ -372,32 +609,40 @@ class DigitalNomadRecommender:
                 raise NoCachedDataError(
                     "Cache-only mode is enabled but no local cache file was found."
                 )
-            latest = _ensure_region_column(latest)
-            latest = _apply_home_country_visa_override(latest)
-            self.combined_data = latest
-            if "nomad_score" not in self.combined_data.columns:
-                self.calculate_nomad_score()
-            self._cache_tag = tag
             dprint(f"[ensure_daily_dataset] Loaded latest available cache (tag={tag})")
-            return self.combined_data
+            return self._adopt_cached(latest, tag)
 
         # 3) No cache or invalid -> scrape and build (regular mode)
         dprint("[ensure_daily_dataset] No valid cache -> scraping")
-        visa_dict = get_visa_data() or {}
-        dprint("[ensure_daily_dataset] Visa dict keys:", list(visa_dict.keys())[:5], "… total:", len(visa_dict))
-
-        cost_df = fetch_cost_of_living(cities=cities)
-        if isinstance(cost_df, pd.DataFrame) and "source" in cost_df.columns:
-            sources = (cost_df["source"].dropna().astype(str)).tolist()
-            joined = " | ".join(sources)
-            if "HTTP 429" in joined:
-                raise CostOfLivingRateLimitError("Cost of living fetch hit a rate limit (HTTP 429).")
-            if "ERROR: HTTP" in joined:
-                raise CostOfLivingFetchError("Cost of living fetch failed with an HTTP error.")
-        if cost_df is None:
-            raise CostOfLivingFetchError("Cost of living fetch returned no data.")
-
-        mobile_country, fixed_country = fetch_speed_data()
+        _check_rate_limit_cooldown()  # before any request, visa page included
+
+        # The visa and Speedtest pages are one request each: fetch them on
+        # worker threads while the per-city Numbeo scrape runs here, so the
+        # three sources overlap instead of running back to back.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            visa_future = pool.submit(get_visa_data)
+            speed_future = pool.submit(fetch_speed_data)
+
+            cost_df = fetch_cost_of_living(cities=cities)
+            visa_dict = visa_future.result() or {}
+            if _debug_on():
+                dprint("[ensure_daily_dataset] Visa dict keys:", list(visa_dict.keys())[:5], "… total:", len(visa_dict))
+
+            if cost_df is None:
+                raise CostOfLivingFetchError("Cost of living fetch returned no data.")
+            if "source" in cost_df.columns:
+                sources = (cost_df["source"].dropna().astype(str)).tolist()
+                joined = " | ".join(sources)
+                if "HTTP 429" in joined:
+                    delay = _start_rate_limit_cooldown(joined)
+                    raise CostOfLivingRateLimitError(
+                        f"Cost of living fetch hit a rate limit (HTTP 429); retry in about {int(delay) + 1} s."
+                    )
+                _clear_rate_limit_cooldown()
+                if "ERROR: HTTP" in joined:
+                    raise CostOfLivingFetchError("Cost of living fetch failed with an HTTP error.")
+
+            mobile_country, fixed_country = speed_future.result()
         if mobile_country is None:
             mobile_country = pd.DataFrame()
         if fixed_country is None:
@@ -410,7 +655,7 @@ class DigitalNomadRecommender:
         self.merge_datasets()
         self.calculate_nomad_score()
 
-        # 4) Write today's CSV and delete any old-day caches
+        # 4) Write today's cache and delete any old-day caches
         if self.combined_data is not None and not self.combined_data.empty:
             _try_write_today(self.combined_data)
 
@@ -418,26 +663,41 @@ class DigitalNomadRecommender:
         dprint("[ensure_daily_dataset] DONE")
         return self.combined_data
 
+    def _adopt_cached(self, df: pd.DataFrame, tag: Optional[str]) -> pd.DataFrame:
+        """Normalize a dataset read from a cache file and make it the in-memory data."""
+        df = _ensure_region_column(df)
+        df = _apply_home_country_visa_override(df)
+        self.combined_data = _compact_dtypes(df)
+        if "nomad_score" not in self.combined_data.columns:
+            self.calculate_nomad_score()
+        self._cache_tag = tag
+        return self.combined_data
+
     # --------------------- loading individual datasets ---------------------
     def load_visa_data(self, visa_dict: Dict[str, List[str]]):
         """Load visa data from dictionary and transform to a flat DataFrame."""
         dprint("[load_visa_data] START")
         self.visa_dict = visa_dict
 
-        visa_records = []
-        for category, countries in visa_dict.items():
-            for country in countries:
-                visa_records.append({
-                    'country': country,
-                    'visa_category': category,
-                    'visa_free': 'visa-free' in category.lower(),
-                    'visa_on_arrival': 'visa on arrival' in category.lower(),
-                    'eta_required': 'eta' in category.lower() or 'electronic' in category.lower(),
-                    'evisa_required': 'e-visa' in category.lower(),
-                    'visa_required': 'requiring visas' in category.lower()
-                })
-
-        self.visa_data = pd.DataFrame(visa_records)
+        # Flatten {category: [countries]} once, then derive every flag with
+        # vectorized substring tests on the lowercased category column.
+        df = pd.DataFrame({
+            'country': list(chain.from_iterable(visa_dict.values())),
+            'visa_category': list(chain.from_iterable(
+                [category] * len(countries) for category, countries in visa_dict.items()
+            )),
+        })
+        low = df['visa_category'].astype(str).str.lower()
+        df['visa_free'] = low.str.contains('visa-free', regex=False)
+        df['visa_on_arrival'] = low.str.contains('visa on arrival', regex=False)
+        df['eta_required'] = (low.str.contains('eta', regex=False)
+                              | low.str.contains('electronic', regex=False))
+        df['evisa_required'] = low.str.contains('e-visa', regex=False)
+        df['visa_required'] = low.str.contains('requiring visas', regex=False)
+
+        self.visa_data = df
+        self._visa_free_countries = frozenset(df.loc[df['visa_free'], 'country'])
+        self._visa_free_source = visa_dict
         dprint("[load_visa_data] rows=", len(self.visa_data), "cols=", list(self.visa_data.columns))
         return self.visa_data
 
@@ -446,17 +706,25 @@ class DigitalNomadRecommender:
         dprint("[load_cost_data] START")
         self.cost_df = cost_df.copy()
 
-        self.cost_df['monthly_cost'] = self.cost_df.apply(
-            lambda row: sum([
-                row.get('rent_1br_city_center_usd', 0) or 0,
-                row.get('utilities_basic_usd', 0) or 0,
-                row.get('internet_60mbps_usd', 0) or 0,
-                row.get('transport_monthly_pass_usd', 0) or 0,
-                row.get('food_estimate_usd', 0) or 0
-            ]), axis=1
+        # Vectorized row sum; missing columns/values count as 0. Rounded to
+        # cents so float32 scraper columns don't leak noise into the total.
+        cost_cols = [
+            'rent_1br_city_center_usd',
+            'utilities_basic_usd',
+            'internet_60mbps_usd',
+            'transport_monthly_pass_usd',
+            'food_estimate_usd',
+        ]
+        self.cost_df['monthly_cost'] = (
+            self.cost_df.reindex(columns=cost_cols, fill_value=0)
+            .astype('float64')
+            .fillna(0)
+            .sum(axis=1)
+            .round(2)
         )
 
-        dprint("[load_cost_data] rows=", len(self.cost_df), "sample:\n", self.cost_df.head(3))
+        if _debug_on():
+            dprint("[load_cost_data] rows=", len(self.cost_df), "sample:\n", self.cost_df.head(3))
         return self.cost_df
 
     def load_speed_data(self, mobile_df: pd.DataFrame, fixed_df: pd.DataFrame):
@@ -479,53 +747,44 @@ class DigitalNomadRecommender:
         dprint("[merge_datasets] START")
         base = self.cost_df.copy()
 
-        city_to_country = {
-            'Zurich': 'Switzerland', 'Paris': 'France', 'Berlin': 'Germany',
-            'Sydney': 'Australia', 'Amsterdam': 'Netherlands', 'Seoul': 'South Korea',
-            'Dubai': 'United Arab Emirates', 'Toronto': 'Canada', 'Tokyo': 'Japan',
-            'London': 'United Kingdom', 'New York': 'United States',
-            'Hong Kong': 'Hong Kong', 'Barcelona': 'Spain',
-            'Johannesburg': 'South Africa', 'Singapore': 'Singapore',
-            'Prague': 'Czech Republic', 'Lisbon': 'Portugal',
-            'Bangkok': 'Thailand', 'Mexico City': 'Mexico'
-        }
-
         dprint("[merge_datasets] base from cost_df shape=", base.shape)
-        base['country'] = base['city'].map(city_to_country)
-        dprint("[merge_datasets] mapped countries sample:\n", base[['city', 'country']].head())
-
-        # Visa-free flag from visa_dict
-        visa_free_countries: set = set()
-        if self.visa_dict:
-            for key, countries in self.visa_dict.items():
-                if 'visa-free' in key.lower():
-                    visa_free_countries.update(countries)
+        base['country'] = base['city'].map(_CITY_TO_COUNTRY)
+        if _debug_on():
+            dprint("[merge_datasets] mapped countries sample:\n", base[['city', 'country']].head())
+
+        # Visa-free flag from visa_dict; the set is built by load_visa_data and
+        # only rebuilt here if visa_dict was swapped without reloading.
+        if self._visa_free_source is not self.visa_dict:
+            self._visa_free_countries = frozenset(
+                c for key, countries in (self.visa_dict or {}).items()
+                if 'visa-free' in key.lower() for c in countries
+            )
+            self._visa_free_source = self.visa_dict
+        visa_free_countries = self._visa_free_countries
         base['visa_free'] = base['country'].isin(visa_free_countries)
         dprint("[merge_datasets] visa_free_countries count:", len(visa_free_countries))
-        dprint("[merge_datasets] visa_free True count:", int(base['visa_free'].sum()))
-
-        # Merge with speeds
-        if self.speed_mobile_df is not None and not self.speed_mobile_df.empty:
-            before = len(base)
-            speed_mobile = self.speed_mobile_df.reset_index()[['Country', 'mobile_mbps']]
-            base = base.merge(speed_mobile, left_on='country', right_on='Country', how='left')
-            base = base.drop('Country', axis=1)
-            dprint(f"[merge_datasets] merged mobile: rows_before={before} rows_after={len(base)}")
-
-        if self.speed_fixed_df is not None and not self.speed_fixed_df.empty:
-            before = len(base)
-            speed_fixed = self.speed_fixed_df.reset_index()[['Country', 'fixed_mbps']]
-            base = base.merge(speed_fixed, left_on='country', right_on='Country', how='left')
-            base = base.drop('Country', axis=1)
-            dprint(f"[merge_datasets] merged fixed: rows_before={before} rows_after={len(base)}")
-
-        # Average speed
-        base['avg_internet_mbps'] = base[['mobile_mbps', 'fixed_mbps']].mean(axis=1)
-        dprint("[merge_datasets] avg_internet_mbps NaN count:", int(base['avg_internet_mbps'].isna().sum()))
+        if _debug_on():
+            dprint("[merge_datasets] visa_free True count:", int(base['visa_free'].sum()))
+
+        # Country-level speeds: one dict lookup per row instead of two merges.
+        base['mobile_mbps'] = base['country'].map(_country_lookup(self.speed_mobile_df, 'mobile_mbps'))
+        base['fixed_mbps'] = base['country'].map(_country_lookup(self.speed_fixed_df, 'fixed_mbps'))
+        if _debug_on():
+            dprint("[merge_datasets] mapped speeds: mobile non-null=", int(base['mobile_mbps'].notna().sum()),
+                   " fixed non-null=", int(base['fixed_mbps'].notna().sum()))
+
+        # Average speed over whichever of the two is available (NaN if neither)
+        speeds = np.stack([base['mobile_mbps'].to_numpy(dtype='float64'),
+                           base['fixed_mbps'].to_numpy(dtype='float64')])
+        counts = np.count_nonzero(~np.isnan(speeds), axis=0)
+        base['avg_internet_mbps'] = np.where(counts > 0, np.nansum(speeds, axis=0) / np.maximum(counts, 1), np.nan)
+        if _debug_on():
+            dprint("[merge_datasets] avg_internet_mbps NaN count:", int(base['avg_internet_mbps'].isna().sum()))
 
         # Enrich region + apply home-country override
         base = _ensure_region_column(base)
         base = _apply_home_country_visa_override(base)
+        base = _compact_dtypes(base)
 
         self.combined_data = base
         dprint("[merge_datasets] DONE shape=", base.shape, "columns=", list(base.columns))
@@ -545,28 +804,37 @@ class DigitalNomadRecommender:
         if self.combined_data is None:
             raise ValueError("Data not merged. Call merge_datasets() first.")
 
-        df = self.combined_data.copy()
+        df = self.combined_data
+
+        # Plain NumPy arrays: the three component scores and the weighted sum
+        # are computed without intermediate Series, then written back at once.
+        visa_free = df['visa_free'].eq(True).to_numpy(dtype=bool, na_value=False)
+        cost = df['monthly_cost'].to_numpy(dtype='float64')
+        speed = df['avg_internet_mbps'].to_numpy(dtype='float64')
 
-        df['visa_score'] = df['visa_free'].apply(lambda x: 100 if bool(x) else 50)
+        visa_score = np.where(visa_free, 100.0, 50.0)
 
         max_cost = df['monthly_cost'].max()
         min_cost = df['monthly_cost'].min()
         dprint(f"[calculate_nomad_score] cost min={min_cost} max={max_cost}")
         denom_cost = (max_cost - min_cost) if max_cost != min_cost else 1.0
-        df['cost_score'] = ((max_cost - df['monthly_cost']) / denom_cost) * 100
+        cost_score = (max_cost - cost) * (100.0 / denom_cost)
 
-        max_speed = df['avg_internet_mbps'].max() if 'avg_internet_mbps' in df.columns else 0
+        max_speed = df['avg_internet_mbps'].max()
         dprint(f"[calculate_nomad_score] speed max={max_speed}")
-        denom_speed = max_speed if max_speed not in (0, None, float('nan')) else 1.0
-        df['speed_score'] = (df['avg_internet_mbps'] / denom_speed) * 100
+        denom_speed = max_speed if max_speed and not np.isnan(max_speed) else 1.0
+        speed_score = speed * (100.0 / denom_speed)
 
-        df['nomad_score'] = (
-            df['visa_score'] * visa_weight +
-            df['cost_score'] * cost_weight +
-            df['speed_score'] * speed_weight
+        nomad_score = (visa_score * visa_weight
+                       + cost_score * cost_weight
+                       + speed_score * speed_weight)
+
+        df[['visa_score', 'cost_score', 'speed_score', 'nomad_score']] = np.column_stack(
+            [visa_score, cost_score, speed_score, nomad_score]
         )
 
-        dprint("[calculate_nomad_score] nomad_score summary:\n", df['nomad_score'].describe())
+        if _debug_on():
+            dprint("[calculate_nomad_score] nomad_score summary:\n", df['nomad_score'].describe())
         self.combined_data = df
         dprint("✓ Calculated nomad scores (weights: visa=", visa_weight, ", cost=", cost_weight, ", speed=", speed_weight, ")")
         dprint("[calculate_nomad_score] DONE")
@@ -588,40 +856,50 @@ class DigitalNomadRecommender:
         if self.combined_data is None or 'nomad_score' not in self.combined_data.columns:
             raise ValueError("Calculate scores first using calculate_nomad_score()")
 
-        df = self.combined_data.copy()
+        # Read-only from here on: the only rows copied are the final top-N.
+        df = self.combined_data
         dprint("[get_recommendations] initial rows:", len(df))
 
-        filtered = df[df['monthly_cost'] <= max_budget]
-        dprint("[get_recommendations] after budget filter:", len(filtered))
+        # Build one boolean mask and index once instead of materializing a
+        # new frame after every filter.
+        mask = (df['monthly_cost'] <= max_budget).to_numpy()
+        if _debug_on():
+            dprint("[get_recommendations] budget filter keeps:", int(mask.sum()))
 
         if region and region.strip() and region.strip().lower() != "global":
-            if "region" in filtered.columns:
-                before = len(filtered)
+            if "region" in df.columns:
                 target = region.strip().casefold()
-                filtered = filtered[filtered["region"].astype(str).str.casefold() == target]
-                dprint("[get_recommendations] after region filter:", len(filtered), f"(dropped {before - len(filtered)})")
+                mask = mask & (df["region"].astype(str).str.casefold() == target).to_numpy()
+                if _debug_on():
+                    dprint("[get_recommendations] + region filter keeps:", int(mask.sum()))
             else:
                 dprint("[get_recommendations] region column missing; skipping region filter")
         else:
             dprint("[get_recommendations] region='Global' or blank -> no region filter applied")
 
         if min_speed:
-            before = len(filtered)
-            filtered = filtered[filtered['avg_internet_mbps'] >= float(min_speed)]
-            dprint("[get_recommendations] after speed filter:", len(filtered), f"(dropped {before - len(filtered)})")
+            mask = mask & (df['avg_internet_mbps'] >= float(min_speed)).to_numpy()
+            if _debug_on():
+                dprint("[get_recommendations] + speed filter keeps:", int(mask.sum()))
 
         if visa_free_only:
-            before = len(filtered)
-            filtered = filtered[filtered['visa_free'] == True]
-            dprint("[get_recommendations] after visa filter:", len(filtered), f"(dropped {before - len(filtered)})")
+            mask = mask & df['visa_free'].eq(True).to_numpy(dtype=bool, na_value=False)
+            if _debug_on():
+                dprint("[get_recommendations] + visa filter keeps:", int(mask.sum()))
 
-        recommendations = filtered.nlargest(top_n, 'nomad_score')
+        rows = np.flatnonzero(mask)
+        top = rows[_top_n_positions(df['nomad_score'].to_numpy()[rows], top_n)]
+        recommendations = df.iloc[top]
 
         result = recommendations[[
             'city', 'country', 'nomad_score', 'monthly_cost',
             'avg_internet_mbps', 'visa_free', 'rent_1br_city_center_usd',
             'internet_60mbps_usd', 'transport_monthly_pass_usd'
-        ]].round(2)
+        ]]
+        # Widen the float32 price columns of the (small) output back to
+        # float64 before rounding; they hold whole cents, so this recovers them.
+        float32_cols = result.select_dtypes('float32').columns
+        result = result.astype(dict.fromkeys(float32_cols, 'float64')).round(2)
 
         dprint("[get_recommendations] final count:", len(result))
         dprint("[get_recommendations] DONE")
@@ -633,42 +911,48 @@ class DigitalNomadRecommender:
 # -----------------------------------------------------------------------------
 _RECOMMENDER: Optional[DigitalNomadRecommender] = None
 
+# Serializes dataset builds: the UI may warm the dataset on a worker thread
+# while a click asks for it too, and both must share one scrape/cache load.
+_BUILD_LOCK = threading.RLock()
+
 def build_recommender(cities: Optional[List[str]] = None) -> DigitalNomadRecommender:
     """
-    Ensure dataset is ready, then return the singleton.
+    Ensure dataset is ready, then return the shared recommender.
+
+    Instances are memoized per (cities, today's tag) — or per cities alone in
+    cache-only mode — so repeat calls are a dict lookup.
 
     Regular mode:
-      • Reuse in-memory instance if it's tagged for today.
+      • Reuse the in-memory instance built today for the same cities.
       • Else ensure today's dataset (load cache or scrape once), then clean old caches.
 
     Cache-only mode:
-      • Reuse any in-memory instance regardless of its tag (never scrape).
+      • Reuse the in-memory instance for the same cities regardless of its tag (never scrape).
       • Else load today's cache or the latest available cache on disk (never scrape).
       • Do NOT delete older cache files (they may be the only usable data).
     """
     dprint("[build_recommender] START cities=", cities)
     global _RECOMMENDER
-    today = _today_tag()
-
-    # Fast path: reuse an existing in-memory recommender
-    if _RECOMMENDER is not None:
-        if CACHE_ONLY_MODE:
-            dprint("[build_recommender] Reusing in-memory recommender (cache-only mode)")
-            return _RECOMMENDER
-        if getattr(_RECOMMENDER, "_cache_tag", None) == today:
-            dprint("[build_recommender] Reusing in-memory recommender for today")
-            return _RECOMMENDER
+    cities_key = tuple(sorted(cities)) if cities else None
+    # Cache-only mode reuses its dataset regardless of the date; regular mode
+    # keys on today's tag so a new day triggers a fresh build.
+    stamp = "cache-only" if CACHE_ONLY_MODE else _today_tag()
+    with _BUILD_LOCK:
+        rec = _cached_recommender(cities_key, stamp)
+    _RECOMMENDER = rec
+    dprint("[build_recommender] DONE; in-memory recommender set")
+    return rec
 
-    # Build/ensure data for this process
+@lru_cache(maxsize=8)
+def _cached_recommender(cities_key: Optional[Tuple[str, ...]], stamp: str) -> DigitalNomadRecommender:
+    """Build (load cache or scrape) one recommender per (cities, day/mode) key."""
+    dprint("[build_recommender] Building recommender for", cities_key, "stamp=", stamp)
     rec = DigitalNomadRecommender()
-    rec.ensure_daily_dataset(cities=cities)
-    _RECOMMENDER = rec
+    rec.ensure_daily_dataset(cities=list(cities_key) if cities_key else None)
 
     # Defensive cleanup only in regular mode (keep older caches in cache-only mode)
     if not CACHE_ONLY_MODE:
-        _cleanup_old_caches(preserve_tag=today)
-
-    dprint("[build_recommender] DONE; in-memory recommender set")
+        _cleanup_old_caches(preserve_tag=stamp)
     return rec
 
 def get_combined_dataset(cities: Optional[List[str]] = None) -> pd.DataFrame:
@@ -680,6 +964,8 @@ def get_combined_dataset(cities: Optional[List[str]] = None) -> pd.DataFrame:
       • returns today's in-memory data if present,
       • otherwise loads today's cache,
       • and only scrapes if today's cache is missing.
+
+    The frame is the recommender's own (no copy); treat it as read-only.
     """
     rec = build_recommender(cities=cities)
     if rec.combined_data is None or rec.combined_data.empty:
@@ -689,7 +975,7 @@ def get_combined_dataset(cities: Optional[List[str]] = None) -> pd.DataFrame:
             "mobile_mbps", "fixed_mbps", "avg_internet_mbps", "nomad_score"
         ]
         return pd.DataFrame(columns=columns)
-    return rec.combined_data.copy()
+    return rec.combined_data
 
 def recommend(max_budget: float,
               min_speed: float = 25,
@@ -708,34 +994,52 @@ def recommend(max_budget: float,
         top_n=top_n,
         region=region,
     )
-    dprint("[recommend] DONE shape:", out.shape)
+    if _debug_on():
+        dprint("[recommend] DONE shape:", out.shape)
     return out
 
 
 # -----------------------------------------------------------------------------
 # UI-facing helpers
 # -----------------------------------------------------------------------------
+# Everything that cannot be part of a plain decimal number ("$", ",", " ", ...).
+_BUDGET_RE = re.compile(r"[^0-9.\-]")
+
 def _normalize_budget(value) -> float:
     """Return a float USD amount from a possibly messy user input."""
-    dprint("[_normalize_budget] raw value:", repr(value))
     if isinstance(value, (int, float)):
         try:
-            out = float(value)
-            dprint("[_normalize_budget] parsed:", out)
-            return out
-        except Exception:
-            dprint("[_normalize_budget] parse failed for numeric")
+            return float(value)
+        except OverflowError:  # ints beyond float range
             return 0.0
 
-    s = str(value).strip()
-    s = re.sub(r"[^0-9.\-]", "", s)
+    s = _BUDGET_RE.sub("", str(value).strip())
     try:
         out = float(s) if s else 0.0
-        dprint("[_normalize_budget] parsed:", out)
-        return out
-    except Exception:
-        dprint("[_normalize_budget] parse failed for string")
+    except ValueError:
+        if _debug_on():
+            dprint("[_normalize_budget] parse failed for", repr(value))
         return 0.0
+    if _debug_on():
+        dprint("[_normalize_budget]", repr(value), "->", out)
+    return out
+
+# Columns of the table build_recommendations hands to the UI, in display order.
+_UI_COLUMNS = ["city", "country", "visa_free", "monthly_cost", "avg_internet_mbps", "nomad_score"]
+_UI_COLUMNS_SET = frozenset(_UI_COLUMNS)
+
+@lru_cache(maxsize=16)
+def _cached_recommendations(rec: DigitalNomadRecommender, cache_tag: Optional[str],
+                            max_budget: float, min_speed: float, visa_free_only: bool,
+                            region: str, top_n: int) -> pd.DataFrame:
+    """get_recommendations memoized per dataset and filter values; do not mutate the result."""
+    return rec.get_recommendations(
+        max_budget=max_budget,
+        min_speed=min_speed,
+        visa_free_only=visa_free_only,
+        top_n=top_n,
+        region=region,
+    )
 
 def build_recommendations(filters: Dict[str, Any]) -> Optional[pd.DataFrame]:
     """Build a recommendations table from UI filters."""
@@ -758,27 +1062,27 @@ def build_recommendations(filters: Dict[str, Any]) -> Optional[pd.DataFrame]:
            " min_downlink=", min_downlink, " visa_only=", visa_only, " region=", repr(region))
 
     try:
-        df = recommend(
-            max_budget=budget,
-            min_speed=min_downlink,
-            visa_free_only=visa_only,
-            top_n=100,             # UI table shows up to 10
-            region=region,
+        rec = build_recommender()
+        # Repeat rebuilds with the same filters reuse the earlier result;
+        # copy-on-write keeps caller edits from reaching the memo.
+        df = _cached_recommendations(
+            rec, rec._cache_tag, budget, min_downlink, visa_only, region,
+            100,                   # UI table shows up to 10
         )
-        expected = ["city", "country", "visa_free", "monthly_cost", "avg_internet_mbps", "nomad_score"]
-        dprint("[build_recommendations] recommend() returned shape:", df.shape, "cols:", list(df.columns))
-        if not all(c in df.columns for c in expected):
+        if _debug_on():
+            dprint("[build_recommendations] recommend() returned shape:", df.shape, "cols:", list(df.columns))
+        if not _UI_COLUMNS_SET.issubset(df.columns):
             dprint("[build_recommendations] reindexing to expected columns")
-            return df.reindex(columns=expected)
+            return df.reindex(columns=_UI_COLUMNS)
         dprint("[build_recommendations] DONE")
-        return df
-    except (CostOfLivingRateLimitError, CostOfLivingFetchError):
+        # Only the columns the UI shows; the rest would just be formatted and dropped.
+        return df[_UI_COLUMNS]
+    except (CostOfLivingRateLimitError, CostOfLivingFetchError, NoCachedDataError):
+        # The UI shows specific guidance for these (including "no local cache yet")
         raise
     except Exception as e:
         dprint("build_recommendations error:", repr(e))
-        return pd.DataFrame(
-            columns=["city", "country", "visa_free", "monthly_cost", "avg_internet_mbps", "nomad_score"]
-        )
+        return pd.DataFrame(columns=_UI_COLUMNS)
 
 # -----------------------------------------------------------------------------
 # Data Explorer passthroughs (cache-first; no direct scraping)
@@ -797,13 +1101,24 @@ def fetch_visa_data(query: Optional[str] = None):
         return rec.visa_dict
     return get_visa_data()
 
-def fetch_cost_of_living_data(query: Optional[str] = None) -> pd.DataFrame:
+# Search keys for the Data Explorer filters. StringDtype keeps missing names
+# as <NA> (never matched) and, with pyarrow, runs str.contains in Arrow.
+_SEARCH_DTYPE = pd.StringDtype("pyarrow" if _HAS_PYARROW else "python")
+
+def _search_key(s: pd.Series) -> pd.Series:
+    """Lowercased copy of `s` for plain substring matching."""
+    return s.astype(_SEARCH_DTYPE).str.lower()
+
+@lru_cache(maxsize=4)
+def _cost_table(rec: DigitalNomadRecommender, cache_tag: Optional[str]):
     """
-    Return Cost of Living rows from the COMBINED CACHE (no direct scraping here).
-    If today's cache is missing, ensure_daily_dataset() will scrape ONCE and build it.
+    (cost_df, city_lower) for the Data Explorer: the cost columns of one
+    recommender's dataset plus its lowercase city names (None without a
+    city column). Keyed on the instance and its cache tag.
     """
-    dprint("[DataExplorer] fetch_cost_of_living_data (cache-first)")
-    df = get_combined_dataset()
+    df = rec.combined_data
+    if df is None or df.empty:
+        df = get_combined_dataset()  # canonical empty shape
     cols = [
         "city",
         "rent_1br_city_center_usd",
@@ -817,51 +1132,111 @@ def fetch_cost_of_living_data(query: Optional[str] = None) -> pd.DataFrame:
     if "source" in df.columns:
         cols.append("source")
     present = [c for c in cols if c in df.columns]
-    out = df[present].copy()
+    out = df[present].reset_index(drop=True)
+    city_lower = _search_key(out["city"]) if "city" in out.columns else None
+    return out, city_lower
 
-    # Optional: apply a quick 'city contains' filter if query passed
+def fetch_cost_of_living_data(query: Optional[str] = None) -> pd.DataFrame:
+    """
+    Return Cost of Living rows from the COMBINED CACHE (no direct scraping here).
+    If today's cache is missing, ensure_daily_dataset() will scrape ONCE and build it.
+    """
+    dprint("[DataExplorer] fetch_cost_of_living_data (cache-first)")
+    rec = build_recommender()
     q = (query or "").strip().lower()
-    if q and "city" in out.columns:
-        out = out[out["city"].astype(str).str.lower().str.contains(q)]
-    dprint("[DataExplorer] COLI rows returned:", len(out))
+    # Shallow copy: free under copy-on-write, and callers never see the memo.
+    out = _cost_rows(rec, rec._cache_tag, q).copy(deep=False)
+    if _debug_on():
+        dprint("[DataExplorer] COLI rows returned:", len(out))
+    return out
+
+@lru_cache(maxsize=64)
+def _cost_rows(rec: DigitalNomadRecommender, cache_tag: Optional[str], q: str) -> pd.DataFrame:
+    """
+    Data Explorer cost rows matching the normalized query `q` (all rows when
+    empty). Keyed on the dataset (instance + cache tag, i.e. the day) and the
+    query, so reopening the tab or repeating a search is a dict lookup.
+    """
+    out, city_lower = _cost_table(rec, cache_tag)
+    # Optional: plain substring filter on the precomputed lowercase names
+    if q and city_lower is not None:
+        out = out[city_lower.str.contains(q, regex=False, na=False).to_numpy(dtype=bool)]
     return out.reset_index(drop=True)
 
+def _country_means(df: pd.DataFrame, key: str, cols: List[str]) -> pd.DataFrame:
+    """
+    NaN-skipping per-key means, sorted by key; the result of
+    df.groupby(key, observed=True)[cols].mean().reset_index() computed with
+    one sort and np.add.reduceat instead of pandas' per-group machinery.
+    """
+    keys = df[key]
+    valid = keys.notna().to_numpy()
+    sorted_keys = keys.to_numpy(dtype=object)[valid]
+    order = np.argsort(sorted_keys, kind="stable")
+    sorted_keys = sorted_keys[order]
+    uniq, starts = np.unique(sorted_keys, return_index=True)
+
+    if isinstance(keys.dtype, pd.CategoricalDtype):
+        out = {key: pd.Categorical(uniq, categories=keys.cat.categories)}
+    else:
+        out = {key: uniq}
+    for col in cols:
+        src = df[col]
+        values = src.to_numpy(dtype="float64", na_value=np.nan)[valid][order]
+        present = ~np.isnan(values)
+        if uniq.size:
+            sums = np.add.reduceat(np.where(present, values, 0.0), starts)
+            counts = np.add.reduceat(present.astype(np.int64), starts)
+        else:
+            sums = counts = np.empty(0)
+        means = np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+        # Keep the column's float width.
+        out[col] = means.astype(src.dtype) if pd.api.types.is_float_dtype(src.dtype) else means
+    return pd.DataFrame(out)
+
+@lru_cache(maxsize=4)
+def _country_speed_tables(rec: DigitalNomadRecommender, cache_tag: Optional[str]):
+    """
+    (mobile_df, fixed_df, country_lower) country-mean speed tables for one
+    recommender's dataset, sorted by Country. Keyed on the instance and its
+    cache tag, so the aggregation runs once per loaded dataset.
+    """
+    df = rec.combined_data
+    if df is None or df.empty:
+        df = pd.DataFrame(columns=["country", "mobile_mbps", "fixed_mbps"])
+    means = _country_means(df, "country", ["mobile_mbps", "fixed_mbps"]).rename(columns={"country": "Country"})
+    mobile = means[["Country", "mobile_mbps"]]
+    fixed = means[["Country", "fixed_mbps"]]
+    country_lower = _search_key(means["Country"])
+    return mobile, fixed, country_lower
+
 def fetch_internet_speed_data(query: Optional[str] = None):
     """
     Return (mobile_df, fixed_df) by aggregating from the COMBINED CACHE (no direct scraping).
     If today's cache is missing, ensure_daily_dataset() will scrape ONCE and build it.
     """
     dprint("[DataExplorer] fetch_internet_speed_data (cache-first)")
-    df = get_combined_dataset()
-    # Derive country-level speeds by mean; ignore NaNs
-    mobile = (
-        df.groupby("country", dropna=True)["mobile_mbps"]
-        .mean(numeric_only=True)
-        .reset_index()
-        .rename(columns={"country": "Country"})
-    )
-    fixed = (
-        df.groupby("country", dropna=True)["fixed_mbps"]
-        .mean(numeric_only=True)
-        .reset_index()
-        .rename(columns={"country": "Country"})
-    )
-
-    # Optional: apply country filter here as well
+    rec = build_recommender()
     q = (query or "").strip().lower()
+    mobile, fixed = _speed_rows(rec, rec._cache_tag, q)
+    mobile, fixed = mobile.copy(deep=False), fixed.copy(deep=False)
+
+    if _debug_on():
+        dprint("[DataExplorer] Speed rows returned: mobile=", len(mobile), " fixed=", len(fixed))
+    return mobile, fixed
+
+@lru_cache(maxsize=64)
+def _speed_rows(rec: DigitalNomadRecommender, cache_tag: Optional[str], q: str):
+    """
+    (mobile_df, fixed_df) rows whose country matches the normalized query `q`
+    (all rows when empty); memoized like _cost_rows.
+    """
+    mobile, fixed, country_lower = _country_speed_tables(rec, cache_tag)
+    # Optional: plain substring filter on the precomputed lowercase names
     if q:
-        if "Country" in mobile.columns:
-            mobile = mobile[mobile["Country"].astype(str).str.lower().str.contains(q)]
-        if "Country" in fixed.columns:
-            fixed = fixed[fixed["Country"].astype(str).str.lower().str.contains(q)]
-
-    # Sort for nicer display
-    if "Country" in mobile.columns:
-        mobile = mobile.sort_values("Country").reset_index(drop=True)
-    if "Country" in fixed.columns:
-        fixed = fixed.sort_values("Country").reset_index(drop=True)
-
-    dprint("[DataExplorer] Speed rows returned: mobile=", len(mobile), " fixed=", len(fixed))
+        keep = country_lower.str.contains(q, regex=False, na=False).to_numpy(dtype=bool)
+        mobile = mobile[keep].reset_index(drop=True)
+        fixed = fixed[keep].reset_index(drop=True)
     return mobile, fixed
 
 # -----------------------------------------------------------------------------
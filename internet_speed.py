@@ -18,15 +18,25 @@ Purpose:
 Imported by: dn_recommendations.py
 
 Imports:
-  Standard library: typing, json, pathlib, time
-  Third-party: pandas, requests
+  Standard library: typing, json, pathlib, time, io, asyncio
+  Third-party: pandas, requests, lxml, aiohttp (optional)
 """
 
 
 from __future__ import annotations
+import asyncio
+from io import BytesIO, StringIO
+
+import lxml.html as LH
+from lxml import etree
 import pandas as pd
 import requests
 
+try:  # Optional: asyncio fetcher (fetch_speed_data_async).
+    import aiohttp  # type: ignore
+except ImportError:  # pragma: no cover - blocking fetcher only
+    aiohttp = None
+
 # Source page that contains the data tables rendered as HTML.
 url = "https://www.speedtest.net/global-index"
 
@@ -39,6 +49,168 @@ headers = {
     )
 }
 
+# Positions of the country tables in the list `pandas.read_html` would return
+# for the whole page.
+_MOBILE_TABLE = 2
+_FIXED_TABLE = 4
+
+# The selector pandas.read_html uses with the lxml parser: every <table>
+# (nested ones included, in document order) that contains some text.
+_TABLES_XPATH = etree.XPath(
+    "//table[.//text()[re:test(., '.+')]]",
+    namespaces={"re": "http://exslt.org/regular-expressions"},
+)
+
+
+# Cells of the rows pandas reads: those under thead/tbody/tfoot or directly
+# under the table (nested tables are not descended into).
+_CELLS_XPATH = etree.XPath("(./thead|./tbody|./tfoot|.)/tr/*[self::td or self::th]")
+
+
+def _is_hidden(elem) -> bool:
+    """True if the element's inline style has display:none (pandas' displayed_only test)."""
+    return "display:none" in elem.attrib.get("style", "").replace(" ", "")
+
+
+def _displayed_tables(root) -> list:
+    """
+    Return the <table> elements `pd.read_html` would consider, in its order.
+
+    Mirrors pandas' default `displayed_only=True` handling for lxml: tables
+    whose own style hides them are dropped, and <style> elements and
+    display:none descendants are removed from the remaining tables (which
+    can leave a table blank, so it is then skipped by `_has_cell_text`).
+
+    Args:
+        root: Parsed lxml HTML document; hidden elements are removed in place.
+
+    Returns:
+        list: The displayed <table> elements, in document order.
+    """
+    tables = [t for t in _TABLES_XPATH(root) if not _is_hidden(t)]
+    for table in tables:
+        for elem in table.xpath(".//style"):
+            elem.drop_tree()
+        for elem in table.xpath(".//*[@style]"):
+            if _is_hidden(elem):
+                elem.drop_tree()
+    return tables
+
+
+def _has_cell_text(table) -> bool:
+    """True if any row cell of `table` has visible text (pandas skips blank tables)."""
+    return any(cell.text_content().strip() for cell in _CELLS_XPATH(table))
+
+
+def _table_to_frame(table) -> pd.DataFrame:
+    """
+    Convert a single lxml <table> element to a DataFrame.
+
+    Args:
+        table: An lxml HTML element for one <table>.
+
+    Returns:
+        pd.DataFrame: The table as parsed by `pandas.read_html`.
+
+    Raises:
+        ValueError: If pandas finds no data in the table.
+    """
+    fragment = LH.tostring(table, encoding="unicode", with_tail=False)
+    return pd.read_html(StringIO(fragment), flavor="lxml")[0]
+
+
+def _select_tables(
+    page: bytes, positions: tuple[int, ...], encoding: str | None = None
+) -> list[pd.DataFrame]:
+    """
+    Return the tables at `positions` of `pd.read_html(page)` without
+    converting every table on the page.
+
+    The page is parsed once with lxml, straight from the response bytes;
+    only the wanted <table> elements are handed to pandas. Tables hidden with
+    display:none and tables whose cells are all blank are skipped, as pandas
+    skips them. If a picked table still turns out to be empty the numbering
+    is ambiguous, so the whole page is parsed the old way instead.
+
+    Args:
+        page: Raw HTML bytes of the page.
+        positions: Table indices to return, in the order wanted.
+        encoding: Character encoding declared by the server, if any; when
+            None lxml detects it from the document.
+
+    Returns:
+        list[pd.DataFrame]: One DataFrame per requested position.
+
+    Raises:
+        ValueError: If the page has too few tables or they cannot be parsed.
+    """
+    parser = LH.HTMLParser(encoding=encoding) if encoding else None
+    root = LH.fromstring(page, parser=parser)
+    tables = [t for t in _displayed_tables(root) if _has_cell_text(t)]
+    if len(tables) <= max(positions):
+        raise ValueError(f"Expected at least {max(positions) + 1} tables, found {len(tables)}")
+    try:
+        return [_table_to_frame(tables[i]) for i in positions]
+    except (ValueError, IndexError):
+        all_tables = pd.read_html(BytesIO(page), flavor="lxml", encoding=encoding)
+        return [all_tables[i] for i in positions]
+
+
+def _tidy_country_table(table: pd.DataFrame) -> pd.DataFrame:
+    """
+    Index a raw country table by its first column and tidy it.
+
+    Rows that are entirely NA (some pages include trailing empty rows) are
+    dropped; rows missing only some values, e.g. a new entry without a rank
+    delta, are kept. The "#.1" column (rank delta) is renamed to the clearer
+    "rank_change", and the index name is removed to keep output tidy.
+
+    Args:
+        table: A country table as returned by `pandas.read_html`.
+
+    Returns:
+        pd.DataFrame: The table indexed by country name (unnamed index).
+    """
+    return (
+        table.set_index(table.columns[0])
+        .dropna(how="all")
+        .rename(columns={"#.1": "rank_change"})
+        .rename_axis(None)
+    )
+
+
+def _parse_speed_page(
+    content: bytes, encoding: str | None = None
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Turn the raw Speedtest Global Index page into the two country tables.
+
+    Pure CPU work with no I/O, shared by the blocking and asyncio fetchers.
+
+    Args:
+        content: Raw HTML bytes of the page.
+        encoding: Character encoding declared by the server, if any.
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame]: (mobile_country_df, fixed_country_df)
+            as documented in `fetch_speed_data`.
+
+    Raises:
+        ValueError: If the expected HTML tables are not present or cannot be
+            parsed by `pandas.read_html`.
+    """
+    # Based on empirical inspection of the page structure:
+    # - tables[2]: Mobile country-level table
+    # - tables[4]: Fixed broadband country-level table
+    # Only those two tables are converted to DataFrames, parsed from the raw
+    # bytes so the body is never decoded into a separate str first.
+    mobile_country, fixed_country = _select_tables(
+        content, (_MOBILE_TABLE, _FIXED_TABLE), encoding=encoding
+    )
+
+    # Normalize: country index, drop all-NA rows, "#.1" -> "rank_change".
+    return _tidy_country_table(mobile_country), _tidy_country_table(fixed_country)
+
 
 def fetch_speed_data() -> tuple[pd.DataFrame, pd.DataFrame]:
     """
@@ -75,30 +247,48 @@ def fetch_speed_data() -> tuple[pd.DataFrame, pd.DataFrame]:
     response = requests.get(url, headers=headers)
     response.raise_for_status()
 
-    # Parse all HTML tables present on the page.
-    tables = pd.read_html(response.text)
+    # Only trust an explicit charset; requests assumes ISO-8859-1 for any
+    # text/* reply without one, while lxml would read the page's <meta>.
+    declared = "charset" in response.headers.get("Content-Type", "").lower()
+    return _parse_speed_page(response.content, response.encoding if declared else None)
 
-    # Based on empirical inspection of the page structure:
-    # - tables[2]: Mobile country-level table
-    # - tables[4]: Fixed broadband country-level table
-    mobile_country = tables[2]
-    fixed_country = tables[4]
-
-    # Normalize: use the first column as the index (country) and drop rows
-    # that are entirely NA (some pages may include trailing empty rows).
-    # Also, rename the "#.1" column (rank delta) to a clearer "rank_change".
-    mobile_country = (
-        mobile_country.set_index(mobile_country.columns[0]).dropna().rename(columns={"#.1": "rank_change"})
-    )
-    fixed_country = (
-        fixed_country.set_index(fixed_country.columns[0]).dropna().rename(columns={"#.1": "rank_change"})
-    )
 
-    # Remove the index name to match the original behavior and keep output tidy.
-    mobile_country.index.name = None
-    fixed_country.index.name = None
+async def fetch_speed_data_async() -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Asyncio counterpart of `fetch_speed_data`.
+
+    The page is downloaded with aiohttp, so other requests awaited on the
+    same event loop (e.g. `fetch_cost_of_living_async`) proceed meanwhile;
+    parsing runs on the loop's default executor to keep the loop free. Run
+    it with `asyncio.run(fetch_speed_data_async())` or gather it with other
+    coroutines.
+
+    Args:
+        None
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame]: (mobile_country_df, fixed_country_df)
+            as documented in `fetch_speed_data`.
+
+    Raises:
+        ImportError: If aiohttp is not installed.
+        aiohttp.ClientResponseError: If the HTTP request fails (non-2xx status).
+        ValueError: If the expected HTML tables are not present or cannot be
+            parsed by `pandas.read_html`.
+    """
+    if aiohttp is None:
+        raise ImportError("fetch_speed_data_async requires the optional 'aiohttp' package.")
+
+    async with aiohttp.ClientSession(
+        headers=headers, timeout=aiohttp.ClientTimeout(total=30)
+    ) as session:
+        async with session.get(url) as resp:
+            resp.raise_for_status()
+            content = await resp.read()
+            encoding = resp.charset
 
-    return mobile_country, fixed_country
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _parse_speed_page, content, encoding)
 
 
 # Simple CLI demo that mirrors the original behavior: fetch and print the heads.
@@ -19,31 +19,42 @@ This file is not imported by any other. It is the main entry point.
 
 Imports:
   Local modules: dn_recommendations
-  Standard library: tkinter, pathlib, json, os, re, math, datetime, typing
-  Third-party: pandas, matplotlib
+  Standard library: tkinter, pathlib, json, os, re, math, datetime, typing, threading, collections
+  Third-party: numpy, pandas, matplotlib, orjson (optional; faster JSON file I/O)
 """
 
 import json
 import re
 import os
 import math
+import queue
+import threading
+from collections import OrderedDict
+import numpy as np
 import pandas as pd
 import tkinter as tk
 import tkinter.font as tkfont
 from tkinter import ttk, messagebox, filedialog
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, Iterable, List, Optional
 import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.image import imread
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
+try:  # Optional: C-accelerated JSON for plans.json; stdlib json otherwise.
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 matplotlib.use("TkAgg")
 
 # Engine API + custom exceptions (from dn_recommendations.py)
 from dn_recommendations import (
     build_recommendations,
+    build_recommender,
     fetch_visa_data,
     fetch_cost_of_living_data,
     fetch_internet_speed_data,
@@ -66,44 +77,116 @@ def _ensure_app_dir() -> None:
     os.makedirs(APP_DIR, exist_ok=True)
 
 
+def _json_dumps(obj: Any, indent: Optional[int] = None) -> bytes:
+    """Serialize to UTF-8 JSON bytes; orjson when installed, else stdlib json."""
+    if orjson is not None and indent in (None, 2):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:  # e.g. non-str keys or big ints: let json decide
+            pass
+    if indent is None:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+    return json.dumps(obj, indent=indent).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes; orjson when installed, else stdlib json."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# plans.json is written compact; set to e.g. 2 for a hand-readable file.
+PLANS_JSON_INDENT: Optional[int] = None
+
+# ((mtime_ns, size), bytes) of the plans file as this process last read or
+# wrote it, so an unchanged save is a bytes comparison instead of a re-read.
+_LAST_PLANS_WRITE: Optional[tuple] = None
+
+
 def _read_plans_store() -> List[Dict[str, Any]]:
     """Load saved plans from disk; return an empty list on error/missing file."""
+    global _LAST_PLANS_WRITE
     _ensure_app_dir()
-    if not os.path.exists(PLANS_FILE):
+    stamp = _file_stamp(PLANS_FILE)
+    if stamp is None:
         return []
     try:
-        with open(PLANS_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(PLANS_FILE, "rb") as f:
+            raw = f.read()
+        if _file_stamp(PLANS_FILE) == stamp:  # not replaced while reading
+            _LAST_PLANS_WRITE = (stamp, raw)
+        data = _json_loads(raw)
         return data if isinstance(data, list) else []
     except Exception:
         return []
 
 
+def _file_stamp(path: str) -> Optional[tuple]:
+    """(mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _atomic_write_bytes(path: str, payload: bytes) -> None:
+    """Write `payload` to a sibling temp file, then rename it over `path`."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
 def _write_plans_store(plans: List[Dict[str, Any]]) -> None:
-    """Atomic write of saved plans to disk."""
+    """Atomic write of saved plans to disk; skipped when the contents are unchanged."""
+    global _LAST_PLANS_WRITE
     _ensure_app_dir()
-    tmp_path = PLANS_FILE + ".tmp"
-    with open(tmp_path, "w", encoding="utf-8") as f:
-        json.dump(plans, f, indent=2)
-    os.replace(tmp_path, PLANS_FILE)
+    payload = _json_dumps(plans, PLANS_JSON_INDENT)
+
+    stamp = _file_stamp(PLANS_FILE)
+    if stamp is not None:
+        if _LAST_PLANS_WRITE is not None and _LAST_PLANS_WRITE[0] == stamp:
+            current = _LAST_PLANS_WRITE[1]
+        else:  # first write this run, or the file changed behind our back
+            try:
+                with open(PLANS_FILE, "rb") as f:
+                    current = f.read()
+            except OSError:
+                current = None
+        if current == payload:
+            _LAST_PLANS_WRITE = (stamp, payload)
+            return
+
+    _atomic_write_bytes(PLANS_FILE, payload)
+    _LAST_PLANS_WRITE = (_file_stamp(PLANS_FILE), payload)
 
 
 def load_all_plans_from_store() -> List[Dict[str, Any]]:
     return _read_plans_store()
 
 
-def save_plan_to_store(plan: Dict[str, Any]) -> None:
+def save_plans_batch(updates: Iterable[Dict[str, Any]]) -> None:
+    """Insert or replace many plans (matched by id) with one read and one write."""
     plans = _read_plans_store()
-    pid = plan.get("id")
+    index: Dict[Any, int] = {}
     for i, p in enumerate(plans):
-        if p.get("id") == pid:
-            plans[i] = plan
-            break
-    else:
-        plans.append(plan)
+        index.setdefault(p.get("id"), i)  # first match wins, as before
+    for plan in updates:
+        pid = plan.get("id")
+        if pid in index:
+            plans[index[pid]] = plan
+        else:
+            index[pid] = len(plans)
+            plans.append(plan)
     _write_plans_store(plans)
 
 
+def save_plan_to_store(plan: Dict[str, Any]) -> None:
+    save_plans_batch([plan])
+
+
 def delete_plan_from_store(plan_id: str) -> None:
     plans = [p for p in _read_plans_store() if p.get("id") != plan_id]
     _write_plans_store(plans)
@@ -135,16 +218,40 @@ class AppState:
     theme: str = "light"          # 'light', 'dark', 'blue'
     default_region: str = "Global"
     saved_plans: List[Plan] = field(default_factory=list)
+    # [plan.__dict__ ...] for JSON output. The dicts are the plans' own, so
+    # edits to a plan show through; reset to None when the list itself changes.
+    _plans_serialized: Optional[List[Dict[str, Any]]] = field(default=None, repr=False)
+
+    def plans_serialized(self) -> List[Dict[str, Any]]:
+        """Plan dicts for saving, rebuilt only after the plan list changed."""
+        if self._plans_serialized is None:
+            self._plans_serialized = [p.__dict__ for p in self.saved_plans]
+        return self._plans_serialized
 
 
 # =============================================================================
 # Small utilities
 # =============================================================================
 
+# Characters dropped from a typed budget ("$2,000" -> "2000")
+_BUDGET_RE = re.compile(r"[^0-9.\-]")
+
+
 def now_iso() -> str:
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 
+def fmt_2dp(col: pd.Series) -> pd.Series:
+    """Format a column for display: numbers to 2 decimals, blanks/NaN to '-', other text as-is."""
+    nums = pd.to_numeric(col, errors="coerce")
+    out = nums.map("{:.2f}".format, na_action="ignore").astype(object)
+    missing = nums.isna().to_numpy()
+    if missing.any():
+        text = col[missing].astype(object).where(col[missing].notna(), "").astype(str).str.strip()
+        out[missing] = text.mask(text.str.lower().isin(("", "nan", "na", "none")), "-").to_numpy()
+    return out
+
+
 def ask_save_path(default_name: str, defaultext: str = ".json") -> Optional[str]:
     return filedialog.asksaveasfilename(
         title="Save As",
@@ -187,6 +294,29 @@ CITY_COORDS: Dict[str, tuple] = {
     "Mexico City": (19.4326, -99.1332),
 }
 
+# Same coordinates as parallel arrays (struct-of-arrays), built once: row i of
+# _CITY_LATLON is (lat, lon) of _CITY_NAMES[i]; CITY_INDEX maps name -> row.
+_CITY_NAMES = np.array(list(CITY_COORDS), dtype=object)
+_CITY_LATLON = np.array(list(CITY_COORDS.values()), dtype=np.float64).reshape(-1, 2)
+CITY_INDEX: Dict[str, int] = {name: i for i, name in enumerate(CITY_COORDS)}
+
+
+@lru_cache(maxsize=1)
+def _load_world_bg() -> Optional[np.ndarray]:
+    """Decode world_map.png once (next to this file, else the CWD); None if unavailable."""
+    candidates = [
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "world_map.png"),
+        "world_map.png",
+    ]
+    for path in candidates:
+        try:
+            if os.path.exists(path):
+                return imread(path)
+        except Exception:
+            # Try the next candidate
+            pass
+    return None
+
 # =============================================================================
 # Main Application
 # =============================================================================
@@ -203,6 +333,41 @@ class NomadUI(tk.Tk):
         ("Settings", "settings"),
     ]
 
+    # Menubar: (menu title, [(item label, NomadUI method name) or ("-", None)]).
+    _MENU_SCHEMA = (
+        ("File", (
+            ("New Plan\tCtrl+N", "new_plan"),
+            ("-", None),
+            ("Save UI State…\tCtrl+S", "file_save_state"),
+            ("Open UI State…\tCtrl+O", "file_open_state"),
+            ("-", None),
+            ("Exit", "on_exit"),
+        )),
+        ("View", (
+            ("Toggle Theme", "toggle_theme"),
+        )),
+        ("Help", (
+            ("Quick Tips", "show_help"),
+            ("About\tF1", "show_about"),
+        )),
+    )
+
+    # Home and Plan Trip (which holds the current results) stay built once
+    # created; the other pages are destroyed when they fall out of the
+    # HOT_PAGE_LIMIT most recently shown and rebuilt on their next visit.
+    PINNED_PAGES = frozenset({"home", "plan"})
+    HOT_PAGE_LIMIT = 3
+
+    # How often (ms) the Tk thread runs callbacks queued by worker threads.
+    UI_POLL_MS = 50
+
+    # theme -> (bg, fg, accent); unknown names fall back to "light".
+    _THEMES = {
+        "light": ("#f8fafc", "#111827", "#2563eb"),
+        "dark": ("#111827", "#e5e7eb", "#3b82f6"),
+        "blue": ("#e8f0fe", "#0f172a", "#2563eb"),
+    }
+
     def __init__(self):
         super().__init__()
         self.title("Digital Nomad Recommendation System - Blue Team")
@@ -211,9 +376,25 @@ class NomadUI(tk.Tk):
 
         self.status_var = tk.StringVar(value="Ready.")
         self.state = AppState()
-        self._load_plans_from_disk()
+        # Worker threads never call into Tk (not even after()): they queue
+        # callbacks with call_on_ui() and the Tk thread runs them from a poll.
+        self._ui_queue: "queue.Queue[tuple]" = queue.Queue()
+        self._drain_ui_queue()
+        # Saved plans are read on a worker thread so the window paints first.
+        self.state.saved_plans = []
+        threading.Thread(target=self._bg_load_plans, daemon=True).start()
+
+        # Named fonts, resolved once and shared by every widget/style using them
+        self.fonts: Dict[str, tkfont.Font] = {
+            "brand": tkfont.Font(self, family="Segoe UI", size=24, weight="bold"),
+            "h1": tkfont.Font(self, family="Segoe UI", size=16, weight="bold"),
+            "nav": tkfont.Font(self, family="Segoe UI", size=11, weight="bold"),
+            "card": tkfont.Font(self, family="Segoe UI", size=12, weight="bold"),
+        }
 
         # ttk theme + global styles
+        self._applied_theme: Optional[str] = None
+        self._style_cache: Dict[tuple, tuple] = {}  # (call, style) -> last options sent
         self.style = ttk.Style(self)
         try:
             self.style.theme_use("clam")
@@ -227,17 +408,20 @@ class NomadUI(tk.Tk):
         self._create_statusbar()
         self._create_body()  # toolbar removed per request
 
-        # Gently useful keybindings
-        self.bind_all("<Control-n>", lambda e: self.new_plan())
-        self.bind_all("<Control-s>", lambda e: self.file_save_state())
-        self.bind_all("<Control-o>", lambda e: self.file_open_state())
-        self.bind_all("<F1>", lambda e: self.show_about())
-        # Ask for data mode immediately at startup
-        self.after(150, self._prompt_for_data_mode)
-
-    def _prompt_for_data_mode(self) -> None:
+        # Gently useful keybindings. Bound on the main window, whose tag every
+        # widget inside it carries, rather than on the global "all" tag.
+        self.bind("<Control-n>", lambda e: self.new_plan())
+        self.bind("<Control-s>", lambda e: self.file_save_state())
+        self.bind("<Control-o>", lambda e: self.file_open_state())
+        self.bind("<F1>", lambda e: self.show_about())
+        # Sessions start in cache-only mode (never scrape). The Home page's
+        # "Data source for this session" panel switches modes without blocking
+        # startup behind a modal dialog.
+        set_cache_only_mode(True)
+
+    def start_data_session(self, wants_fresh: bool) -> None:
         """
-        On app launch, ask the user to choose how this session loads data.
+        Apply the data source chosen on the Home page and prepare the dataset.
 
         This desktop build runs entirely on your machine. A production deployment
         would refresh data once per day on a server and the app would read that
@@ -247,30 +431,44 @@ class NomadUI(tk.Tk):
         • Download fresh data now (may take a while): scrape sources and build today's dataset.
         • Use local cache only (no downloads): load the most recent dataset already saved on this computer.
         """
-        msg = (
-            "How should this session load its data?\n\n"
-            "Option 1 (Yes) — Download fresh data now (slower):\n"
-            "  Scrape sources and build today's dataset. This can take a while.\n\n"
-            "Option 2 (No) — Use local cache only (faster):\n"
-            "  Load the most recent dataset already saved on this computer.\n\n"
-            "Note: This is a lightweight desktop build. A full service would refresh\n"
-            "data daily on a server and the app would read that cloud snapshot.\n\n"
-            "Do you want to download fresh data now?"
-        )
+        mode = "Local cache only" if not wants_fresh else "Fresh download"
+        self.status(f"Data mode: {mode} — preparing dataset…")
+        # Switch modes and load (or scrape) the dataset on a worker thread; the
+        # engine's build lock makes an early "Get Recommendations" wait for it.
+        threading.Thread(
+            target=self._bg_prepare_dataset, args=(wants_fresh, mode), daemon=True
+        ).start()
+
+    def _bg_prepare_dataset(self, wants_fresh: bool, mode: str) -> None:
+        """Worker thread: apply the data mode, warm the dataset, report via call_on_ui()."""
         try:
-            wants_fresh = messagebox.askyesno(
-                "Data source for this session", msg, icon="question", default="yes"
-            )
-        except Exception:
-            # Safe default if dialogs cannot be shown
-            wants_fresh = True
+            # True  -> cache-only mode (NEVER scrape; load latest cache on disk)
+            # False -> regular mode (use today's cache else scrape once)
+            set_cache_only_mode(not wants_fresh)
+            build_recommender()
+        except NoCachedDataError:
+            text = f"Data mode: {mode} — no local dataset found."
+        except Exception as e:
+            text = f"Data mode: {mode} — dataset not ready ({type(e).__name__}); it will be retried on request."
+        else:
+            text = f"Data mode: {mode} — dataset ready."
+        self.call_on_ui(self.status, text)
 
-        # Map user choice to a single boolean that drives behavior in the engine.
-        # True  -> cache-only mode (NEVER scrape; load latest cache on disk)
-        # False -> regular mode (use today's cache else scrape once)
-        set_cache_only_mode(not wants_fresh)
+    def call_on_ui(self, func, *args) -> None:
+        """Thread-safe: queue func(*args) to run on the Tk thread."""
+        self._ui_queue.put((func, args))
 
-        self.status("Data mode: " + ("Local cache only" if not wants_fresh else "Fresh download"))
+    def _drain_ui_queue(self) -> None:
+        """Tk thread: run every queued worker callback, then poll again."""
+        try:
+            while True:
+                try:
+                    func, args = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                func(*args)
+        finally:
+            self.after(self.UI_POLL_MS, self._drain_ui_queue)
 
     # --------------------------
     # UI Construction
@@ -283,25 +481,14 @@ class NomadUI(tk.Tk):
 
     def _create_menubar(self) -> None:
         menubar = tk.Menu(self)
-
-        file_menu = tk.Menu(menubar, tearoff=False)
-        file_menu.add_command(label="New Plan\tCtrl+N", command=self.new_plan)
-        file_menu.add_separator()
-        file_menu.add_command(label="Save UI State…\tCtrl+S", command=self.file_save_state)
-        file_menu.add_command(label="Open UI State…\tCtrl+O", command=self.file_open_state)
-        file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.on_exit)
-
-        view_menu = tk.Menu(menubar, tearoff=False)
-        view_menu.add_command(label="Toggle Theme", command=self.toggle_theme)
-
-        help_menu = tk.Menu(menubar, tearoff=False)
-        help_menu.add_command(label="Quick Tips", command=self.show_help)
-        help_menu.add_command(label="About\tF1", command=self.show_about)
-
-        menubar.add_cascade(label="File", menu=file_menu)
-        menubar.add_cascade(label="View", menu=view_menu)
-        menubar.add_cascade(label="Help", menu=help_menu)
+        for title, items in self._MENU_SCHEMA:
+            menu = tk.Menu(menubar, tearoff=False)
+            for label, method in items:
+                if label == "-":
+                    menu.add_separator()
+                else:
+                    menu.add_command(label=label, command=getattr(self, method))
+            menubar.add_cascade(label=title, menu=menu)
         self.config(menu=menubar)
 
     def _create_body(self) -> None:
@@ -311,15 +498,18 @@ class NomadUI(tk.Tk):
         # Sidebar
         self.sidebar = ttk.Frame(body, width=220)
         self.sidebar.pack(side=tk.LEFT, fill=tk.Y)
-        ttk.Label(self.sidebar, text="Navigation", font=("Segoe UI", 11, "bold")).pack(
+        ttk.Label(self.sidebar, text="Navigation", font=self.fonts["nav"]).pack(
             anchor="w", padx=12, pady=(12, 6)
         )
-        self.nav_list = tk.Listbox(self.sidebar, activestyle="dotbox", exportselection=False)
+        # One flat button per page; show_page restyles the active one.
+        nav = ttk.Frame(self.sidebar)
+        nav.pack(fill=tk.BOTH, expand=True, padx=12)
+        self._nav_buttons: Dict[str, ttk.Button] = {}
+        self._nav_active: Optional[str] = None
         for title, key in self.PAGES:
-            self.nav_list.insert(tk.END, title)
-        self.nav_list.selection_set(0)
-        self.nav_list.bind("<<ListboxSelect>>", self._on_nav_select)
-        self.nav_list.pack(fill=tk.BOTH, expand=True, padx=12)
+            btn = ttk.Button(nav, text=title, style="Nav.TButton", command=lambda k=key: self.show_page(k))
+            btn.pack(fill=tk.X, pady=1)
+            self._nav_buttons[key] = btn
 
         # Sidebar quick actions
         actions = ttk.Frame(self.sidebar)
@@ -329,6 +519,12 @@ class NomadUI(tk.Tk):
 
         # Main area (stack)
         self.main_area = ttk.Frame(body); self.main_area.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # Pages share one grid cell; show_page raises the active one. The area
+        # takes its size from the window (as with place), so building or
+        # raising a page never propagates a new requested size upwards.
+        self.main_area.rowconfigure(0, weight=1)
+        self.main_area.columnconfigure(0, weight=1)
+        self.main_area.grid_propagate(False)
         self.pages: Dict[str, tk.Frame] = {}
         self._build_pages()
         self.show_page("home")
@@ -337,20 +533,30 @@ class NomadUI(tk.Tk):
         ttk.Label(self, textvariable=self.status_var, anchor="w", padding=(8, 2)).pack(side=tk.BOTTOM, fill=tk.X)
 
     def _build_pages(self) -> None:
-        self.pages["home"] = HomePage(self.main_area, self)
-        self.pages["plan"] = PlanTripPage(self.main_area, self)       # now with Map + Dashboard tabs
-        self.pages["data"] = DataExplorerPage(self.main_area, self)   # already handles "-"
-        self.pages["saved"] = SavedPage(self.main_area, self)         # with search bar
-        self.pages["compare"] = ComparePage(self.main_area, self)     # plan selection preserved
-        self.pages["settings"] = SettingsPage(self.main_area, self)
-        for page in self.pages.values():
-            page.place(relx=0, rely=0, relwidth=1, relheight=1)
+        """Register page classes; each page is built on first use (see page())."""
+        self._page_factories: Dict[str, type] = {
+            "home": HomePage,
+            "plan": PlanTripPage,         # now with Map + Dashboard tabs
+            "data": DataExplorerPage,     # already handles "-"
+            "saved": SavedPage,           # with search bar
+            "compare": ComparePage,       # plan selection preserved
+            "settings": SettingsPage,
+        }
+        self._hot_pages: "OrderedDict[str, None]" = OrderedDict()  # unpinned, least recent first
+
+    def page(self, key: str) -> Optional[tk.Frame]:
+        """Return the page for `key`, building it on first request (None if unknown)."""
+        page = self.pages.get(key)
+        if page is None and key in self._page_factories:
+            page = self.pages[key] = self._page_factories[key](self.main_area, self)
+            page.grid(row=0, column=0, sticky="nsew")
+        return page
 
     # --------------------------
     # Theming
     # --------------------------
     def toggle_theme(self) -> None:
-        order = ["light", "dark", "blue"]
+        order = list(self._THEMES)  # light -> dark -> blue
         try:
             idx = order.index(self.state.theme)
         except ValueError:
@@ -361,48 +567,64 @@ class NomadUI(tk.Tk):
 
     def _apply_theme(self) -> None:
         theme = self.state.theme
-        if theme == "dark":
-            bg, fg, accent = "#111827", "#e5e7eb", "#3b82f6"
-        elif theme == "blue":
-            bg, fg, accent = "#e8f0fe", "#0f172a", "#2563eb"
-        else:
-            bg, fg, accent = "#f8fafc", "#111827", "#2563eb"
+        # Restyling makes every ttk widget redraw; skip it if nothing changed.
+        if theme == self._applied_theme:
+            return
+        bg, fg, accent = self._THEMES.get(theme, self._THEMES["light"])
         self.configure(bg=bg)
-        self.style.configure("TFrame", background=bg)
-        self.style.configure("TLabel", background=bg, foreground=fg)
-        self.style.configure("TButton", padding=6)
-        self.style.configure("TEntry", fieldbackground="#ffffff")
-        self.style.configure("Brand.TLabel", background=bg, foreground=accent, font=("Segoe UI", 24, "bold"))
-        self.style.map("TButton", foreground=[("active", fg)], background=[("active", accent)])
+        self._style("configure", "TFrame", background=bg)
+        self._style("configure", "TLabel", background=bg, foreground=fg)
+        self._style("configure", "TButton", padding=6)
+        self._style("configure", "TEntry", fieldbackground="#ffffff")
+        self._style("configure", "Brand.TLabel", background=bg, foreground=accent, font=self.fonts["brand"])
+        self._style("configure", "Card.TLabel", font=self.fonts["card"])  # QuickLink titles
+        self._style("map", "TButton", foreground=[("active", fg)], background=[("active", accent)])
+        # Sidebar navigation: flat, left-aligned; the current page uses the accent.
+        self._style("configure", "Nav.TButton", anchor="w", relief="flat", background=bg, foreground=fg)
+        self._style("configure", "NavActive.TButton", anchor="w", relief="flat", background=accent, foreground="#ffffff")
+        self._applied_theme = theme
+
+    def _style(self, call: str, style_name: str, **options: Any) -> None:
+        """style.configure/style.map, skipped when these exact options were last sent."""
+        sig = tuple(sorted(options.items()))
+        if self._style_cache.get((call, style_name)) == sig:
+            return
+        self._style_cache[(call, style_name)] = sig
+        getattr(self.style, call)(style_name, **options)
 
     # --------------------------
     # Navigation & Status
     # --------------------------
     def show_page(self, key: str) -> None:
-        page = self.pages.get(key)
+        page = self.page(key)
         if not page:
             return
-        for p in self.pages.values():
-            p.place_forget()
-        page.place(relx=0, rely=0, relwidth=1, relheight=1)
-        for idx, (_, k) in enumerate(self.PAGES):
-            if k == key:
-                self.nav_list.selection_clear(0, tk.END)
-                self.nav_list.selection_set(idx)
-                break
+        page.tkraise()  # re-stack only; no geometry pass over the other pages
+        if key != self._nav_active:
+            if self._nav_active is not None:
+                self._nav_buttons[self._nav_active].configure(style="Nav.TButton")
+            self._nav_buttons[key].configure(style="NavActive.TButton")
+            self._nav_active = key
 
         # Keep Compare plan choices up-to-date whenever the page is shown
         if key == "compare":
-            compare_page: "ComparePage" = self.pages["compare"]  # type: ignore
+            compare_page: "ComparePage" = page  # type: ignore
             compare_page.refresh_plan_choices()
 
         self.status(f"Viewing: {key.title()}")
+        self._touch_page(key)
 
-    def _on_nav_select(self, _) -> None:
-        sel = self.nav_list.curselection()
-        if not sel:
+    def _touch_page(self, key: str) -> None:
+        """Mark an unpinned page as just shown; destroy the least recent beyond the limit."""
+        if key in self.PINNED_PAGES:
             return
-        self.show_page(self.PAGES[sel[0]][1])
+        self._hot_pages[key] = None
+        self._hot_pages.move_to_end(key)
+        while len(self._hot_pages) > self.HOT_PAGE_LIMIT:
+            old_key, _ = self._hot_pages.popitem(last=False)
+            old_page = self.pages.pop(old_key, None)
+            if old_page is not None:
+                old_page.destroy()
 
     def status(self, text: str) -> None:
         self.status_var.set(text)
@@ -412,7 +634,7 @@ class NomadUI(tk.Tk):
     # --------------------------
     def new_plan(self) -> None:
         self.show_page("plan")
-        page: "PlanTripPage" = self.pages["plan"]  # type: ignore
+        page: "PlanTripPage" = self.page("plan")  # type: ignore
         page.reset_filters()
         self.status("New plan created.")
 
@@ -423,29 +645,46 @@ class NomadUI(tk.Tk):
         data = {
             "theme": self.state.theme,
             "default_region": self.state.default_region,
-            "saved_plans": [plan.__dict__ for plan in self.state.saved_plans],
+            "saved_plans": self.state.plans_serialized(),
         }
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-        self.status(f"UI state saved to {os.path.basename(path)}")
-        messagebox.showinfo("Save", "UI state saved.")
+        # Encode here (orjson when installed; indented since users open the
+        # file by hand) so the worker writes a snapshot of the current plans.
+        payload = _json_dumps(data, indent=2)
+        self.status(f"Saving UI state to {os.path.basename(path)}…")
+        threading.Thread(target=self._save_state_worker, args=(path, payload), daemon=True).start()
+
+    def _save_state_worker(self, path: str, payload: bytes) -> None:
+        """Worker thread: write the UI state file atomically, then report via call_on_ui()."""
+        try:
+            _atomic_write_bytes(path, payload)
+        except Exception as e:
+            self.call_on_ui(messagebox.showerror, "Save", f"Failed to save UI state.\n\n{e}")
+            return
+
+        def done() -> None:
+            self.status(f"UI state saved to {os.path.basename(path)}")
+            messagebox.showinfo("Save", "UI state saved.")
+        self.call_on_ui(done)
 
     def file_open_state(self) -> None:
         path = ask_open_path()
         if not path:
             return
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(path, "rb") as f:
+                data = _json_loads(f.read())
             self.state.theme = data.get("theme", self.state.theme)
             self.state.default_region = data.get("default_region", self.state.default_region)
             plans = [Plan(**p) for p in data.get("saved_plans", [])]
+            serialized = [p.__dict__ for p in plans]
             self.state.saved_plans = plans
-            _write_plans_store([p.__dict__ for p in plans])
+            self.state._plans_serialized = serialized
+            _write_plans_store(serialized)
 
             self._apply_theme()
-            saved: "SavedPage" = self.pages["saved"]  # type: ignore
-            saved.refresh()
+            saved: Optional["SavedPage"] = self.pages.get("saved")  # type: ignore
+            if saved is not None:  # an unbuilt page lists the plans when first shown
+                saved.refresh()
 
             self.status(f"Loaded UI state from {os.path.basename(path)}")
             messagebox.showinfo("Open", "UI state loaded.")
@@ -463,13 +702,22 @@ class NomadUI(tk.Tk):
         if not path:
             return
         headers = ["City", "Country", "Visa-Free", "Monthly Cost (USD)", "Avg Internet (Mbps)", "Score"]
+        lines = [",".join(headers)]
+        threading.Thread(target=self._export_csv_worker, args=(path, lines), daemon=True).start()
+
+    def _export_csv_worker(self, path: str, lines: List[str]) -> None:
+        """Worker thread: write the CSV in one call, then report via call_on_ui()."""
         try:
             with open(path, "w", encoding="utf-8") as f:
-                f.write(",".join(headers) + "\n")
+                f.write("\n".join(lines) + "\n")
+        except Exception as e:
+            self.call_on_ui(messagebox.showerror, "Export", f"Failed to export.\n\n{e}")
+            return
+
+        def done() -> None:
             messagebox.showinfo("Export", "Export complete (empty template with headers).")
             self.status("Results CSV template exported.")
-        except Exception as e:
-            messagebox.showerror("Export", f"Failed to export.\n\n{e}")
+        self.call_on_ui(done)
 
     def show_help(self) -> None:
         tips = (
@@ -486,25 +734,34 @@ class NomadUI(tk.Tk):
             "About",
             "Digital Nomad Recommendation System\n\n"
             "Plan smarter with consolidated visa, cost of living, and internet speed data.\n"
-            "Created by Blue Team as a Data Focused Python (95888-C1) final project.\n",
-            "Team Members:\n",
-            "• Arturo Arias\n",
-            "• Madison Shen\n",
-            "• Jiafu Wang\n",
-            "• Jiaqi Xu\n",
+            "Created by Blue Team as a Data Focused Python (95888-C1) final project.\n\n"
+            "Team Members:\n"
+            "• Arturo Arias\n"
+            "• Madison Shen\n"
+            "• Jiafu Wang\n"
+            "• Jiaqi Xu\n"
             "• Jiaming Zhu\n",
         )
 
     def on_exit(self) -> None:
         self.destroy()
 
-    def _load_plans_from_disk(self) -> None:
-        """Initial load of saved plans."""
+    def _bg_load_plans(self) -> None:
+        """Worker thread: read plans.json, then hand the plans to the Tk thread via call_on_ui()."""
         try:
-            raw_plans = load_all_plans_from_store()
-            self.state.saved_plans = [Plan(**p) for p in raw_plans]
+            plans = [Plan(**p) for p in load_all_plans_from_store()]
         except Exception:
-            self.state.saved_plans = []
+            plans = []
+        self.call_on_ui(self._apply_loaded_plans, plans)
+
+    def _apply_loaded_plans(self, plans: List[Plan]) -> None:
+        """Install plans read by _bg_load_plans, keeping any saved meanwhile."""
+        loaded = {p.id for p in plans}
+        self.state.saved_plans = plans + [p for p in self.state.saved_plans if p.id not in loaded]
+        self.state._plans_serialized = None
+        saved: Optional["SavedPage"] = self.pages.get("saved")  # type: ignore
+        if saved is not None:
+            saved.refresh()
 
 
 # =============================================================================
@@ -512,11 +769,19 @@ class NomadUI(tk.Tk):
 # =============================================================================
 
 class HomePage(ttk.Frame):
+    # (card title, page key) for the quick-link row
+    QUICK_LINKS = (
+        ("Plan Trip", "plan"),
+        ("Data Explorer", "data"),
+        ("Saved Plans", "saved"),
+        ("Settings", "settings"),
+    )
+
     def __init__(self, parent, app: NomadUI):
         super().__init__(parent)
         self.app = app
 
-        header = ttk.Label(self, text="Welcome, Digital Nomad!", font=("Segoe UI", 16, "bold"))
+        header = ttk.Label(self, text="Welcome, Digital Nomad!", font=app.fonts["h1"])
         sub = ttk.Label(
             self,
             text=(
@@ -530,23 +795,38 @@ class HomePage(ttk.Frame):
         sub.pack(anchor="w", padx=18)
         cta.pack(anchor="w", padx=18, pady=12)
 
+        # Non-modal data-source choice; cache-only until Start is clicked.
+        source = ttk.Labelframe(self, text="Data source for this session", padding=12)
+        source.pack(fill=tk.X, padx=18, pady=(0, 6))
+        self.var_source = tk.StringVar(value="cache")
+        ttk.Radiobutton(
+            source, text="Use local cache only (faster; no downloads)",
+            variable=self.var_source, value="cache",
+        ).pack(anchor="w")
+        ttk.Radiobutton(
+            source, text="Download fresh data now (slower; scrapes today's dataset if missing)",
+            variable=self.var_source, value="fresh",
+        ).pack(anchor="w")
+        ttk.Button(
+            source, text="Start",
+            command=lambda: app.start_data_session(self.var_source.get() == "fresh"),
+        ).pack(anchor="w", pady=(8, 0))
+
         sep = ttk.Separator(self); sep.pack(fill=tk.X, padx=18, pady=12)
 
         quick = ttk.Frame(self); quick.pack(fill=tk.BOTH, expand=True, padx=18, pady=6)
-        QuickLink(quick, text="Plan Trip", cmd=lambda: app.show_page("plan")).grid(row=0, column=0, padx=8, pady=8, sticky="nsew")
-        QuickLink(quick, text="Data Explorer", cmd=lambda: app.show_page("data")).grid(row=0, column=1, padx=8, pady=8, sticky="nsew")
-        QuickLink(quick, text="Saved Plans", cmd=lambda: app.show_page("saved")).grid(row=0, column=2, padx=8, pady=8, sticky="nsew")
-        QuickLink(quick, text="Settings", cmd=lambda: app.show_page("settings")).grid(row=0, column=3, padx=8, pady=8, sticky="nsew")
-
-        for i in range(4):
-            quick.columnconfigure(i, weight=1)
+        for col, (title, key) in enumerate(self.QUICK_LINKS):
+            QuickLink(quick, text=title, cmd=lambda k=key: app.show_page(k)).grid(
+                row=0, column=col, padx=8, pady=8, sticky="nsew"
+            )
+            quick.columnconfigure(col, weight=1)
         quick.rowconfigure(0, weight=1)
 
 
 class QuickLink(ttk.Frame):
     def __init__(self, parent, text: str, cmd):
         super().__init__(parent, padding=16)
-        ttk.Label(self, text=text, font=("Segoe UI", 12, "bold")).pack(anchor="w")
+        ttk.Label(self, text=text, style="Card.TLabel").pack(anchor="w")
         ttk.Button(self, text="Open", command=cmd).pack(anchor="w", pady=(8, 0))
 
 
@@ -557,6 +837,19 @@ class QuickLink(ttk.Frame):
 class PlanTripPage(ttk.Frame):
     """Planner page: filter inputs + results table + map + dashboard."""
 
+    # Results table columns, in display order, with the placeholder shown
+    # when a results frame lacks the column
+    TABLE_COLUMNS = {
+        "city": "",
+        "country": "",
+        "visa_free": "",
+        "monthly_cost": "-",
+        "avg_internet_mbps": "-",
+        "nomad_score": "-",
+    }
+    # Rows inserted per idle-time batch once the first screenful is shown
+    TABLE_BATCH = 200
+
     def __init__(self, parent, app: NomadUI):
         super().__init__(parent)
         self.app = app
@@ -564,6 +857,9 @@ class PlanTripPage(ttk.Frame):
         # To render charts/maps from the last recommendation call
         self.last_df_table = None    # formatted for table (strings)
         self.last_df_raw = None      # numeric values for plotting
+        self._left_margins: Dict[Any, float] = {}   # dashboard figure -> applied left margin
+        self._last_visa = None       # what the visa pie currently shows (counts or a note)
+        self._table_fill = 0         # bumped per table fill/clear; stale batches stop
 
         # ---------------- Filters Panel ----------------
         filters = ttk.Labelframe(self, text="Filters", padding=12)
@@ -608,9 +904,12 @@ class PlanTripPage(ttk.Frame):
         # ---------------- Action Buttons ----------------
         btns = ttk.Frame(self)
         btns.pack(side=tk.TOP, fill=tk.X, padx=18, pady=(6, 6))
-        ttk.Button(btns, text="Get Recommendations", command=self.on_get_recs).pack(side=tk.LEFT)
+        self.btn_get_recs = ttk.Button(btns, text="Get Recommendations", command=self.on_get_recs)
+        self.btn_get_recs.pack(side=tk.LEFT)
         ttk.Button(btns, text="Save Plan", command=self.on_save_plan).pack(side=tk.LEFT, padx=(8, 0))
         ttk.Button(btns, text="Reset Filters", command=self.reset_filters).pack(side=tk.LEFT, padx=(8, 0))
+        # Shown (and animated) only while recommendations are being built
+        self.prog_recs = ttk.Progressbar(btns, mode="indeterminate", length=140)
 
         # ---------------- Results (Notebook) ----------------
         wrap = ttk.Labelframe(self, text="Results", padding=8)
@@ -620,7 +919,7 @@ class PlanTripPage(ttk.Frame):
         # Tab 1: Table
         self.tab_table = ttk.Frame(self.nb_results)
         self.nb_results.add(self.tab_table, text="Table")
-        cols = ("city", "country", "visa_free", "monthly_cost", "avg_internet_mbps", "nomad_score")
+        cols = tuple(self.TABLE_COLUMNS)
         self.tree = ttk.Treeview(self.tab_table, columns=cols, show="headings", height=18)
         headings = [
             ("city", "City"),
@@ -657,14 +956,13 @@ class PlanTripPage(ttk.Frame):
         self.tab_dash = ttk.Frame(self.nb_results)
         self.nb_results.add(self.tab_dash, text="Dashboard")
 
-        self.lbl_reco = ttk.Label(self.tab_dash, text="Recommended destination: —", font=("Segoe UI", 12, "bold"))
+        self.lbl_reco = ttk.Label(self.tab_dash, text="Recommended destination: —", font=self.app.fonts["card"])
         self.lbl_reco.pack(anchor="w", padx=8, pady=(4, 6))
 
         charts = ttk.Frame(self.tab_dash); charts.pack(fill=tk.BOTH, expand=True)
         # Cost bar
         self.fig_cost = plt.Figure(figsize=(4.5, 3.5), dpi=100)
         self.ax_cost = self.fig_cost.add_subplot(111)
-        self.ax_cost.set_title("Monthly Cost (USD)")
         self.ax_cost.tick_params(axis="x", rotation=30)
         self.canvas_cost = FigureCanvasTkAgg(self.fig_cost, master=charts)
         self.canvas_cost.get_tk_widget().grid(row=0, column=0, sticky="nsew", padx=6, pady=6)
@@ -672,7 +970,6 @@ class PlanTripPage(ttk.Frame):
         # Speed bar
         self.fig_speed = plt.Figure(figsize=(4.5, 3.5), dpi=100)
         self.ax_speed = self.fig_speed.add_subplot(111)
-        self.ax_speed.set_title("Average Internet Speed (Mbps)")
         self.ax_speed.tick_params(axis="x", rotation=30)
         self.canvas_speed = FigureCanvasTkAgg(self.fig_speed, master=charts)
         self.canvas_speed.get_tk_widget().grid(row=0, column=1, sticky="nsew", padx=6, pady=6)
@@ -689,7 +986,16 @@ class PlanTripPage(ttk.Frame):
         charts.rowconfigure(0, weight=1)
         charts.rowconfigure(1, weight=1)
 
+        # Bar charts keep their artists; refreshes only move bars and labels
+        self._cost_panel = self._setup_bar_panel(
+            self.fig_cost, self.ax_cost, "Lowest Monthly Cost — Top 5 Countries", "USD"
+        )
+        self._speed_panel = self._setup_bar_panel(
+            self.fig_speed, self.ax_speed, "Highest Average Internet Speed — Top 5 Countries", "Mbps"
+        )
+
         # Draw an empty map initially so the tab doesn't look blank
+        self._setup_map()
         self._render_map(None)
 
     # ----- Helpers -----
@@ -711,12 +1017,12 @@ class PlanTripPage(ttk.Frame):
 
     # ----- Actions -----
     def on_get_recs(self) -> None:
-        """Fetch recommendations and update the table + map + dashboard."""
+        """Validate the budget and build recommendations on a worker thread (see _apply_recs)."""
         filters = self.current_filters()
 
         # Robust budget parsing with friendly message
         raw = (self.var_budget.get() or "").strip()
-        norm = re.sub(r"[^0-9.\-]", "", raw)
+        norm = _BUDGET_RE.sub("", raw)
         try:
             budget_val = float(norm) if norm else 0.0
         except Exception:
@@ -729,38 +1035,71 @@ class PlanTripPage(ttk.Frame):
 
         filters["budget"] = str(budget_val)
 
-        # Call the engine and show specific errors for COLI fetching
+        # The engine may load or scrape data, so it runs on a worker thread;
+        # the button stays disabled until that build reports back.
+        self.btn_get_recs.state(["disabled"])
+        self.prog_recs.pack(side=tk.LEFT, padx=(12, 0))
+        self.prog_recs.start(12)
+        self.app.status("Building recommendations…")
+        threading.Thread(target=self._recs_worker, args=(filters,), daemon=True).start()
+
+    def _recs_worker(self, filters: Dict[str, Any]) -> None:
+        """Worker thread: run the engine, then hand the outcome to the Tk thread."""
         try:
-            df = build_recommendations(filters)
-        except CostOfLivingRateLimitError as e:
+            df, error = build_recommendations(filters), None
+        except Exception as e:
+            df, error = None, e
+        self.app.call_on_ui(self._apply_recs, df, error)
+
+    def _apply_recs(self, df: Optional[pd.DataFrame], error: Optional[Exception]) -> None:
+        """Tk thread: show the engine's result (or error) in the table, map and dashboard."""
+        self.prog_recs.stop()
+        self.prog_recs.pack_forget()
+        self.btn_get_recs.state(["!disabled"])
+
+        # Show specific errors for COLI fetching
+        if isinstance(error, CostOfLivingRateLimitError):
             messagebox.showerror(
                 "Temporarily rate-limited",
                 "Cost of living data is temporarily unavailable (HTTP 429 rate limit).\n"
-                "Please wait ~2–5 minutes and try again.\n\nDetails:\n" + str(e)
+                "Please wait ~2–5 minutes and try again.\n\nDetails:\n" + str(error)
             )
+            self.app.status("Cost of living data rate-limited.")
             return
-        except CostOfLivingFetchError as e:
+        if isinstance(error, CostOfLivingFetchError):
             messagebox.showerror(
                 "Couldn’t fetch cost data",
                 "We couldn’t fetch cost of living data right now.\n"
-                "Please try again shortly.\n\nDetails:\n" + str(e)
+                "Please try again shortly.\n\nDetails:\n" + str(error)
             )
+            self.app.status("Cost of living data unavailable.")
             return
-        except NoCachedDataError:
+        if isinstance(error, NoCachedDataError):
             messagebox.showinfo(
                 "No local data available",
                 "You selected the quick start that avoids downloading, but there is no "
                 "local dataset on disk yet.\n\n"
-                "Restart the app and choose “Download fresh data now” to build the dataset once."
+                "On the Home page, choose “Download fresh data now” and click Start to "
+                "build the dataset once."
             )
             self.app.status("No local cache available; fresh download required.")
             return
-        except Exception as e:
-            print("Error in build_recommendations:", e)
+        if error is not None:
+            print("Error in build_recommendations:", error)
+            self.app.status("Could not build recommendations.")
+            return
 
-        # Clear previous table rows
-        for iid in self.tree.get_children():
-            self.tree.delete(iid)
+        # The engine memoizes results per filter set, so re-running the same
+        # filters returns an equal frame; the table, map and dashboard
+        # already show it, so skip repopulating them.
+        if df is not None and not df.empty and self.last_df_raw is not None and df.equals(self.last_df_raw):
+            self.app.status("Recommendations unchanged.")
+            return
+
+        # Clear previous table rows (one Tk call) and stop any pending batches
+        self.tree.delete(*self.tree.get_children())
+        self._table_fill += 1
+        self.last_df_raw = None
 
         if df is None:
             messagebox.showinfo("Recommendations", "Please enter a positive monthly budget in USD (e.g., 2000).")
@@ -778,43 +1117,29 @@ class PlanTripPage(ttk.Frame):
             self._render_dashboard(None)
             return
 
-        # Preserve a raw numeric copy for plotting
-        self.last_df_raw = df.copy()
-
-        # Nice rounding for display; '-' for NaN (table)
-        def fmt_num(v: Any) -> str:
-            try:
-                f = float(v)
-                if math.isnan(f):
-                    return "-"
-                return f"{f:.2f}"
-            except Exception:
-                s = "" if v is None else str(v).strip()
-                return "-" if s == "" or s.lower() in ("nan", "na", "none") else s
+        # Keep the raw numeric frame for plotting. The engine hands back a new
+        # frame per call and copy-on-write keeps later edits from reaching it,
+        # so no defensive copy is needed.
+        self.last_df_raw = df
 
-        table_df = df.copy()
-        for col in ("monthly_cost", "avg_internet_mbps", "nomad_score"):
-            if col in table_df.columns:
-                table_df[col] = table_df[col].apply(fmt_num)
+        # Nice rounding for display; '-' for NaN (table). assign() shares the
+        # untouched text columns and only allocates the formatted ones.
+        table_df = df.assign(**{
+            col: fmt_2dp(df[col])
+            for col in ("monthly_cost", "avg_internet_mbps", "nomad_score")
+            if col in df.columns
+        })
 
         self.last_df_table = table_df
 
-        # Populate table (tag top row)
-        for idx, row in enumerate(table_df.itertuples(index=False)):
-            tags = ("top1",) if idx == 0 else ()
-            self.tree.insert(
-                "",
-                tk.END,
-                values=(
-                    getattr(row, "city", ""),
-                    getattr(row, "country", ""),
-                    getattr(row, "visa_free", ""),
-                    getattr(row, "monthly_cost", "-"),
-                    getattr(row, "avg_internet_mbps", "-"),
-                    getattr(row, "nomad_score", "-"),
-                ),
-                tags=tags,
-            )
+        # Populate table (tag top row). Row tuples come from whole columns
+        # zipped together rather than per-row attribute lookups.
+        n = len(table_df)
+        columns = [
+            table_df[c].tolist() if c in table_df.columns else [missing] * n
+            for c, missing in self.TABLE_COLUMNS.items()
+        ]
+        self._fill_table(list(zip(*columns)))
 
         # Update Map & Dashboard
         self._render_map(self.last_df_raw)
@@ -827,9 +1152,11 @@ class PlanTripPage(ttk.Frame):
         plan_name = f"Plan {datetime.now().strftime('%Y%m%d-%H%M%S')}"
         plan = Plan(id=plan_name, name=plan_name, created_at=now_iso(), filters=filters)
         self.app.state.saved_plans.append(plan)
+        self.app.state._plans_serialized = None
         save_plan_to_store(plan.__dict__)
-        saved: "SavedPage" = self.app.pages["saved"]  # type: ignore
-        saved.refresh()
+        saved: Optional["SavedPage"] = self.app.pages.get("saved")  # type: ignore
+        if saved is not None:  # an unbuilt page lists the plans when first shown
+            saved.refresh()
         messagebox.showinfo("Plan Saved", f"Saved filter set as ‘{plan_name}’.")
         self.app.status(f"Saved plan: {plan_name}")
 
@@ -841,146 +1168,204 @@ class PlanTripPage(ttk.Frame):
         self.var_requires_visa_free.set(True)
         self.var_min_downlink.set("25")
         self.app.status("Filters reset.")
-        # Clear table
-        for iid in self.tree.get_children():
-            self.tree.delete(iid)
+        # Clear table (and the last result, so the next request re-renders)
+        self.tree.delete(*self.tree.get_children())
+        self._table_fill += 1
+        self.last_df_raw = None
         # Clear visuals
         self._render_map(None)
         self._render_dashboard(None)
 
+    def _fill_table(self, rows: List[tuple]) -> None:
+        """Insert result rows: the visible screenful now, the rest in idle-time batches."""
+        self._table_fill += 1
+        self._insert_rows(rows, 0, int(self.tree.cget("height")), self._table_fill)
+
+    def _insert_rows(self, rows: List[tuple], start: int, stop: int, fill: int) -> None:
+        """Insert rows[start:stop] (tagging the top row), then schedule the next batch."""
+        if fill != self._table_fill:
+            return  # a newer fill or a clear replaced this table
+        for idx in range(start, min(stop, len(rows))):
+            self.tree.insert("", tk.END, values=rows[idx], tags=("top1",) if idx == 0 else ())
+        if stop < len(rows):
+            self.after_idle(self._insert_rows, rows, stop, stop + self.TABLE_BATCH, fill)
+
     # ----- Visualization helpers -----
-    def _render_map(self, df):
+    def _setup_map(self) -> None:
         """
-        Render the Recommendations Map using a PNG world background.
+        Create the map's persistent artists once: background, markers, ring, note, colorbar.
 
-        Assumes a file named 'world_map.png' lives in the SAME folder as this file.
-        The image is drawn with geographic extents (-180..180 lon, -90..90 lat) so
-        city coordinates align. Falls back to a simple ocean color if the image
+        The world image comes from _load_world_bg(), decoded once per process, and
+        is drawn with geographic extents (-180..180 lon, -90..90 lat) so city
+        coordinates align. Falls back to a simple ocean color if the image
         cannot be loaded (but does NOT draw the old generated polygons).
-
-        Expected instance attrs:
-        - self.ax_map (matplotlib Axes)
-        - self.fig_map (matplotlib Figure)
-        - self.canvas_map (FigureCanvasTkAgg)
-        - CITY_COORDS (dict: city -> (lat, lon))
         """
-        
-
-        # Remove an existing colorbar (if any) so we don't stack them on refresh
-        if hasattr(self, "_map_cbar") and self._map_cbar:
-            try:
-                self._map_cbar.remove()
-            except Exception:
-                pass
-            self._map_cbar = None
+        ax = self.ax_map
+        img = _load_world_bg()
+        if img is not None:
+            # Anchor the image to world lon/lat bounds
+            self._map_bg_im = ax.imshow(
+                img,
+                extent=(-180, 180, -90, 90),
+                origin="upper",
+                aspect="auto",
+                zorder=0,
+            )
+        else:
+            self._map_bg_im = None
+            ax.set_facecolor("#cae9ff")
+            ax.grid(True, linestyle="--", alpha=0.25, linewidth=0.5)
+        ax.set_xlim(-180, 180)
+        ax.set_ylim(-90, 90)
+        ax.set_xlabel("Longitude")
+        ax.set_ylabel("Latitude")
+
+        # Markers start empty; colors are fixed to the 0.25..1 intensity range
+        self._map_scatter = ax.scatter(
+            np.empty(0), np.empty(0), s=np.empty(0), c=np.empty(0),
+            cmap="Blues", vmin=0.25, vmax=1.0,
+            alpha=0.9, edgecolor="k", linewidth=0.6, zorder=10
+        )
+        # Orange ring around the top city
+        self._map_top = ax.scatter(
+            np.empty(0), np.empty(0),
+            s=420, facecolors="none", edgecolors="#ff5722",
+            linewidth=2.2, zorder=12
+        )
+        self._map_note = ax.text(
+            0.5, 0.5, "",
+            ha="center", va="center",
+            transform=ax.transAxes,
+            fontsize=11, color="#374151",
+            zorder=20,
+        )
+        self._map_cbar = self.fig_map.colorbar(self._map_scatter, ax=ax, fraction=0.035, pad=0.04)
+        self._map_cbar.set_label("Relative Score Intensity")
 
-        self.ax_map.clear()
-        self.ax_map.set_title("Recommendations Map")
+        # Blitting: the data artists are animated, so a full draw renders only
+        # the static map. Every full draw (first paint, resize) re-captures that
+        # background; refreshes restore it and repaint just the data artists.
+        self._map_dynamic = (self._map_scatter, self._map_top, self._map_note)
+        for artist in self._map_dynamic:
+            artist.set_animated(True)
+        self._map_bg = None
+        self.canvas_map.mpl_connect("draw_event", self._on_map_draw)
+
+    def _on_map_draw(self, event) -> None:
+        """After a full map draw: cache the static background, then paint the data artists."""
+        self._map_bg = self.canvas_map.copy_from_bbox(self.ax_map.bbox)
+        for artist in self._map_dynamic:
+            self.ax_map.draw_artist(artist)
 
-        # Try to load ./world_map.png (relative to this file or CWD)
-        bg_loaded = False
-        candidates = [
-            os.path.join(os.path.dirname(os.path.abspath(__file__)), "world_map.png"),
-            "world_map.png",
-        ]
-        for path in candidates:
-            try:
-                if os.path.exists(path):
-                    img = imread(path)
-                    # Anchor the image to world lon/lat bounds
-                    self.ax_map.imshow(
-                        img,
-                        extent=(-180, 180, -90, 90),
-                        origin="upper",
-                        aspect="auto",
-                        zorder=0,
-                    )
-                    bg_loaded = True
-                    break
-            except Exception:
-                # Try the next candidate
-                pass
+    def _render_map(self, df):
+        """
+        Update the Recommendations Map for a results frame (or None).
 
-        # Establish axes limits either way
-        self.ax_map.set_xlim(-180, 180)
-        self.ax_map.set_ylim(-90, 90)
+        Only the persistent artists from _setup_map() change: marker offsets,
+        sizes and colors, the top-city ring, the centered note and the colorbar's
+        visibility. The background image is never re-read or re-added.
 
-        # Simple fallback if the PNG isn't available
-        if not bg_loaded:
-            self.ax_map.set_facecolor("#cae9ff")
-            self.ax_map.grid(True, linestyle="--", alpha=0.25, linewidth=0.5)
+        Expected instance attrs:
+        - self.ax_map (matplotlib Axes)
+        - self.fig_map (matplotlib Figure)
+        - self.canvas_map (FigureCanvasTkAgg)
+        - CITY_INDEX / _CITY_LATLON (city -> row of (lat, lon))
 
+        Refreshes blit the data artists over the cached background; a full
+        draw is only requested (via draw_idle()) when that cache is missing.
+        """
         # No data? Show a friendly message over the background
         if df is None or df.empty:
-            self.ax_map.text(
-                0.5, 0.5, "No data",
-                ha="center", va="center",
-                transform=self.ax_map.transAxes,
-                fontsize=11, color="#374151",
-                zorder=20,
-            )
-            self.canvas_map.draw()
+            self._show_map_markers(np.empty((0, 2)), np.empty(0), np.empty(0), None, "No data")
             return
 
-        # Build plotting arrays and scale by nomad_score
-        lats, lons, sizes, colors = [], [], [], []
-        try:
-            smin = float(df["nomad_score"].min()); smax = float(df["nomad_score"].max())
-        except Exception:
+        # Scores as one float array; scale markers by nomad_score
+        if "nomad_score" in df.columns:
+            scores = pd.to_numeric(df["nomad_score"], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+        else:
+            scores = np.zeros(len(df))
+        scored = ~np.isnan(scores)
+        if scored.any():
+            smin = float(scores[scored].min()); smax = float(scores[scored].max())
+        else:
             smin, smax = 0.0, 1.0
         spread = (smax - smin) if smax != smin else 1.0
 
-        for r in df.to_dict(orient="records"):
-            city = str(r.get("city") or "").strip()
-            if city not in CITY_COORDS:
-                continue
-            lat, lon = CITY_COORDS[city]
-            score = float(r.get("nomad_score", 0.0) or 0.0)
-            size = 50.0 + 300.0 * ((score - smin) / spread)      # 50..350
-            color = 0.25 + 0.75 * ((score - smin) / spread)       # 0.25..1 (for cmap)
-            lats.append(lat); lons.append(lon); sizes.append(size); colors.append(color)
-
-        if not lats:
-            self.ax_map.text(
-                0.5, 0.5, "No mappable cities in results",
-                ha="center", va="center",
-                transform=self.ax_map.transAxes,
-                fontsize=11, color="#374151",
-                zorder=20,
+        # Look every result city up in the coordinate table at once
+        if "city" in df.columns:
+            cities = df["city"].astype(object).fillna("").astype(str).str.strip()
+            rows = cities.map(CITY_INDEX).to_numpy(dtype="float64", na_value=np.nan)
+        else:
+            rows = np.full(len(df), np.nan)
+        mappable = ~np.isnan(rows)
+        latlon = _CITY_LATLON[rows[mappable].astype(np.intp)]
+        lats, lons = latlon[:, 0], latlon[:, 1]
+        rel = (scores[mappable] - smin) / spread
+        sizes = 50.0 + 300.0 * rel      # 50..350
+        colors = 0.25 + 0.75 * rel      # 0.25..1 (for cmap)
+
+        if not lats.size:
+            self._show_map_markers(
+                np.empty((0, 2)), np.empty(0), np.empty(0), None, "No mappable cities in results"
             )
-            self.canvas_map.draw()
             return
 
-        # Plot markers over the map
-        sc = self.ax_map.scatter(
-            lons, lats,
-            s=sizes, c=colors, cmap="Blues",
-            alpha=0.9, edgecolor="k", linewidth=0.6, zorder=10
-        )
-
-        # Emphasize the top city with an orange ring
-        try:
-            idx_top = int(df["nomad_score"].idxmax())
-            top_city = str(df.loc[idx_top, "city"])
-            if top_city in CITY_COORDS:
-                tlat, tlon = CITY_COORDS[top_city]
-                self.ax_map.scatter(
-                    [tlon], [tlat],
-                    s=420, facecolors="none", edgecolors="#ff5722",
-                    linewidth=2.2, zorder=12
-                )
-        except Exception:
-            pass
-
-        # Colorbar legend (store handle so we can remove on refresh)
-        self._map_cbar = self.fig_map.colorbar(sc, ax=self.ax_map, fraction=0.035, pad=0.04)
-        self._map_cbar.set_label("Relative Score Intensity")
-
-        # Subtle axis labels
-        self.ax_map.set_xlabel("Longitude")
-        self.ax_map.set_ylabel("Latitude")
-
-        self.canvas_map.draw()
+        # Emphasize the top city with an orange ring (if it is on the map)
+        top = None
+        if "nomad_score" in df.columns and scored.any():
+            i_top = int(np.nanargmax(scores))
+            if mappable[i_top]:
+                tlat, tlon = _CITY_LATLON[int(rows[i_top])]
+                top = (tlon, tlat)
+
+        self._show_map_markers(np.column_stack((lons, lats)), sizes, colors, top, "")
+
+    def _show_map_markers(self, offsets, sizes, colors, top, note: str) -> None:
+        """Push marker data into the persistent map artists and blit them (full draw if needed)."""
+        self._map_scatter.set_offsets(offsets)
+        self._map_scatter.set_sizes(sizes)
+        self._map_scatter.set_array(colors)
+        self._map_top.set_offsets(np.empty((0, 2)) if top is None else np.array([top]))
+        self._map_note.set_text(note)
+        cbar_visible = bool(len(offsets))
+        if self._map_bg is None or self._map_cbar.ax.get_visible() != cbar_visible:
+            # No cached background yet, or the static layer changed: full draw
+            self._map_cbar.ax.set_visible(cbar_visible)
+            self.canvas_map.draw_idle()
+            return
+        self.canvas_map.restore_region(self._map_bg)
+        for artist in self._map_dynamic:
+            self.ax_map.draw_artist(artist)
+        self.canvas_map.blit(self.ax_map.bbox)
+
+    def _setup_bar_panel(self, fig, ax, title: str, unit: str) -> Dict[str, Any]:
+        """Create a dashboard bar chart's persistent artists: five bars, a note and a centered title."""
+        bars = ax.barh(range(5), [0.0] * 5, height=0.4)
+        ax.set_xlabel(unit)
+        ax.set_ylabel("Country")
+        ax.grid(axis="x", linestyle="--", alpha=0.25)
+        ax.tick_params(axis="y", pad=8)
+        note = ax.text(0.5, 0.5, "", ha="center", va="center", transform=ax.transAxes)
+        # Centered title across the whole figure (not just the shrunken subplot)
+        sup = fig.suptitle(title, y=0.98, ha="center")
+        panel = {"ax": ax, "bars": bars, "note": note, "title": sup}
+        self._show_bars(panel, [], [], "No data")
+        return panel
+
+    def _show_bars(self, panel: Dict[str, Any], names: List[str], values: List[float], note: str = "") -> None:
+        """Point a bar panel's bars at up to five (name, value) pairs, hiding the rest; or show a note."""
+        ax = panel["ax"]
+        n = len(names)
+        for i, rect in enumerate(panel["bars"]):
+            rect.set_width(values[i] if i < n else 0.0)
+            rect.set_visible(i < n)
+        ax.set_yticks(range(n))
+        ax.set_yticklabels(names)
+        ax.set_ylim(max(n, 1) - 0.5, -0.5)   # inverted: first row on top
+        ax.relim()
+        ax.autoscale_view(scalex=True, scaley=False)
+        panel["note"].set_text(note)
+        panel["title"].set_visible(bool(n))
 
     def _render_dashboard(self, df):
         """
@@ -994,25 +1379,13 @@ class PlanTripPage(ttk.Frame):
         • Keep ONLY the barplot titles centered (using figure-level suptitle so centering isn't affected by subplot shifts).
         """
 
-        # Clear axes
-        for ax in (self.ax_cost, self.ax_speed, self.ax_visa):
-            ax.clear()
-
-        # Remove any previous figure-level suptitles so they don't stack
-        for fig in (self.fig_cost, self.fig_speed):
-            if getattr(fig, "_suptitle", None) is not None:
-                try:
-                    fig._suptitle.remove()
-                except Exception:
-                    pass
-                fig._suptitle = None
-
+        # The bar charts reuse their artists; the pie is redrawn only when it changes
         if df is None or df.empty:
             self.lbl_reco.configure(text="Recommended destination: —")
-            self.ax_cost.text(0.5, 0.5, "No data", ha="center", va="center", transform=self.ax_cost.transAxes)
-            self.ax_speed.text(0.5, 0.5, "No data", ha="center", va="center", transform=self.ax_speed.transAxes)
-            self.ax_visa.text(0.5, 0.5, "No data", ha="center", va="center", transform=self.ax_visa.transAxes)
-            self.canvas_cost.draw(); self.canvas_speed.draw(); self.canvas_visa.draw()
+            self._show_bars(self._cost_panel, [], [], "No data")
+            self._show_bars(self._speed_panel, [], [], "No data")
+            self._render_visa_pie("No data")
+            self.canvas_cost.draw(); self.canvas_speed.draw()
             return
 
         # Recommended destination (top nomad_score)
@@ -1029,6 +1402,23 @@ class PlanTripPage(ttk.Frame):
             longest = max((len(str(n)) for n in names), default=0)
             return min(max_left, base + per_char * longest)
 
+        # Re-layout a bar figure only when its left margin actually changes
+        def _fit_left_margin(fig, names):
+            lm = _left_margin(names)
+            if self._left_margins.get(fig) != lm:
+                fig.subplots_adjust(left=lm, right=0.98, top=0.82, bottom=0.18)
+                self._left_margins[fig] = lm
+
+        # Helper to pick the k rows with the smallest values in one column, in
+        # order. A stable sort breaks ties by row position, like
+        # nsmallest/nlargest(keep="first"), so equal values never swap places
+        # between refreshes; the per-country table is small.
+        def _smallest_rows(tbl, col, k=5, negate=False):
+            vals = tbl[col].to_numpy(dtype="float64")
+            if negate:
+                vals = -vals
+            return tbl.iloc[np.argsort(vals, kind="stable")[:k]]
+
         # ----------------------------- Monthly Cost (USD) -----------------------------
         try:
             cost_tbl = (
@@ -1039,30 +1429,17 @@ class PlanTripPage(ttk.Frame):
             if cost_tbl.empty:
                 raise ValueError("No valid cost data")
 
-            cost_agg = cost_tbl.groupby("country", as_index=False)["monthly_cost"].mean()
-            bottom5_cost = cost_agg.nsmallest(5, "monthly_cost")
+            cost_agg = cost_tbl.groupby("country", as_index=False, observed=True)["monthly_cost"].mean()
+            bottom5_cost = _smallest_rows(cost_agg, "monthly_cost")
 
             countries_cost = bottom5_cost["country"].astype(str).tolist()
             costs = bottom5_cost["monthly_cost"].tolist()
 
             # Give labels lots of room; keep bars narrow
-            lm = _left_margin(countries_cost)
-            self.fig_cost.subplots_adjust(left=lm, right=0.98, top=0.82, bottom=0.18)
-
-            self.ax_cost.barh(countries_cost, costs, height=0.4)
-            # Axis labels; title handled by figure-level suptitle for true centering
-            self.ax_cost.set_xlabel("USD")
-            self.ax_cost.set_ylabel("Country")
-            self.ax_cost.invert_yaxis()
-            self.ax_cost.grid(axis="x", linestyle="--", alpha=0.25)
-            self.ax_cost.tick_params(axis="y", pad=8)
-
-            # Centered title across the whole figure (not just the shrunken subplot)
-            self.fig_cost._suptitle = self.fig_cost.suptitle(
-                "Lowest Monthly Cost — Top 5 Countries", y=0.98, ha="center"
-            )
+            _fit_left_margin(self.fig_cost, countries_cost)
+            self._show_bars(self._cost_panel, countries_cost, costs)
         except Exception:
-            self.ax_cost.text(0.5, 0.5, "Cost data error", ha="center", va="center", transform=self.ax_cost.transAxes)
+            self._show_bars(self._cost_panel, [], [], "Cost data error")
 
         # ---------------------- Average Internet Speed (Mbps) -------------------------
         try:
@@ -1074,44 +1451,45 @@ class PlanTripPage(ttk.Frame):
             if speed_tbl.empty:
                 raise ValueError("No valid speed data")
 
-            speed_agg = speed_tbl.groupby("country", as_index=False)["avg_internet_mbps"].mean()
-            top5_speed = speed_agg.nlargest(5, "avg_internet_mbps")
+            speed_agg = speed_tbl.groupby("country", as_index=False, observed=True)["avg_internet_mbps"].mean()
+            top5_speed = _smallest_rows(speed_agg, "avg_internet_mbps", negate=True)
 
             countries_speed = top5_speed["country"].astype(str).tolist()
             speeds = top5_speed["avg_internet_mbps"].tolist()
 
-            lm = _left_margin(countries_speed)
-            self.fig_speed.subplots_adjust(left=lm, right=0.98, top=0.82, bottom=0.18)
-
-            self.ax_speed.barh(countries_speed, speeds, height=0.4)
-            self.ax_speed.set_xlabel("Mbps")
-            self.ax_speed.set_ylabel("Country")
-            self.ax_speed.invert_yaxis()
-            self.ax_speed.grid(axis="x", linestyle="--", alpha=0.25)
-            self.ax_speed.tick_params(axis="y", pad=8)
-
-            self.fig_speed._suptitle = self.fig_speed.suptitle(
-                "Highest Average Internet Speed — Top 5 Countries", y=0.98, ha="center"
-            )
+            _fit_left_margin(self.fig_speed, countries_speed)
+            self._show_bars(self._speed_panel, countries_speed, speeds)
         except Exception:
-            self.ax_speed.text(0.5, 0.5, "Speed data error", ha="center", va="center", transform=self.ax_speed.transAxes)
+            self._show_bars(self._speed_panel, [], [], "Speed data error")
 
         # ----------------------------- Visa Restrictions ------------------------------
         try:
             free = int(df["visa_free"].astype(bool).sum())
             total = int(len(df))
             req = max(0, total - free)
+            self._render_visa_pie((free, req))
+        except Exception:
+            self._render_visa_pie("Visa data error")
+
+        # Draw canvases (the visa pie draws itself when it changes)
+        self.canvas_cost.draw()
+        self.canvas_speed.draw()
+
+    def _render_visa_pie(self, counts) -> None:
+        """Draw the visa pie for (free, requires-visa) counts, or a note; skipped if already shown."""
+        if counts == self._last_visa:
+            return
+        self._last_visa = counts
+        self.ax_visa.clear()
+        if isinstance(counts, str):
+            self.ax_visa.text(0.5, 0.5, counts, ha="center", va="center", transform=self.ax_visa.transAxes)
+        else:
+            free, req = counts
             labels = ["Visa-Free", "Requires Visa"]
             sizes = [free, req] if (free + req) > 0 else [1, 0]
             self.ax_visa.pie(sizes, labels=labels, autopct="%1.0f%%", startangle=90)
             self.ax_visa.axis("equal")
             self.ax_visa.set_title("Visa Restrictions")
-        except Exception:
-            self.ax_visa.text(0.5, 0.5, "Visa data error", ha="center", va="center", transform=self.ax_visa.transAxes)
-
-        # Draw canvases
-        self.canvas_cost.draw()
-        self.canvas_speed.draw()
         self.canvas_visa.draw()
 
 # =============================================================================
@@ -1286,7 +1664,7 @@ class DataExplorerPage(ttk.Frame):
             messagebox.showinfo(
                 "No local data available",
                 "Cache-only mode is on, but no cached dataset was found.\n\n"
-                "Restart and choose “Download fresh data now” to build the dataset."
+                "On the Home page, choose “Download fresh data now” and click Start."
             )
             return
         except Exception as e:
@@ -1338,7 +1716,7 @@ class DataExplorerPage(ttk.Frame):
             messagebox.showinfo(
                 "No local data available",
                 "Cache-only mode is on, but no cached dataset was found.\n\n"
-                "Restart and choose “Download fresh data now” to build the dataset."
+                "On the Home page, choose “Download fresh data now” and click Start."
             )
             return
         except Exception as e:
@@ -1404,7 +1782,7 @@ class SavedPage(ttk.Frame):
 
         # Header + refresh
         top = ttk.Frame(self); top.pack(side=tk.TOP, fill=tk.X, padx=18, pady=(18, 6))
-        ttk.Label(top, text="Saved Plans", font=("Segoe UI", 12, "bold")).pack(side=tk.LEFT)
+        ttk.Label(top, text="Saved Plans", font=self.app.fonts["card"]).pack(side=tk.LEFT)
         ttk.Button(top, text="Refresh", command=self.refresh).pack(side=tk.RIGHT)
 
         # Search bar for plan names (case-insensitive)
@@ -1477,7 +1855,7 @@ class SavedPage(ttk.Frame):
         if not plan:
             messagebox.showinfo("Open", "Please select a plan.")
             return
-        page: "PlanTripPage" = self.app.pages["plan"]  # type: ignore
+        page: "PlanTripPage" = self.app.page("plan")  # type: ignore
 
         f = plan.filters
         page.var_budget.set(f.get("budget", ""))
@@ -1515,6 +1893,7 @@ class SavedPage(ttk.Frame):
             return
         delete_plan_from_store(plan.id)
         self.app.state.saved_plans = [p for p in self.app.state.saved_plans if p.id != plan.id]
+        self.app.state._plans_serialized = None
         self.refresh()
         self.app.status(f"Deleted plan: {plan.name}")
 
@@ -1526,8 +1905,8 @@ class SavedPage(ttk.Frame):
         path = ask_save_path(f"{plan.name}.json")
         if not path:
             return
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(plan.__dict__, f, indent=2)
+        with open(path, "wb") as f:
+            f.write(_json_dumps(plan.__dict__, indent=2))
         messagebox.showinfo("Export", f"Exported {plan.name} to JSON.")
         self.app.status(f"Exported plan JSON: {os.path.basename(path)}")
 
@@ -1548,7 +1927,7 @@ class ComparePage(ttk.Frame):
         self.app = app
 
         top = ttk.Frame(self); top.pack(side=tk.TOP, fill=tk.X, padx=18, pady=(18, 6))
-        ttk.Label(top, text="Compare Saved Plans", font=("Segoe UI", 12, "bold")).pack(side=tk.LEFT)
+        ttk.Label(top, text="Compare Saved Plans", font=self.app.fonts["card"]).pack(side=tk.LEFT)
 
         # Selection row (Plan A / Plan B)
         sel = ttk.Frame(self); sel.pack(side=tk.TOP, fill=tk.X, padx=18, pady=(6, 6))
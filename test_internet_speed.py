@@ -0,0 +1,56 @@
+"""
+Parity checks for internet_speed._select_tables against pandas.read_html.
+
+Run from the project folder:
+    python -m unittest test_internet_speed
+"""
+
+import unittest
+from io import BytesIO
+
+import pandas as pd
+
+from internet_speed import _select_tables
+
+
+def _table(label: str, style: str = "") -> str:
+    attr = f' style="{style}"' if style else ""
+    return f"<table{attr}><tr><th>h</th></tr><tr><td>{label}</td></tr></table>"
+
+
+class SelectTablesTest(unittest.TestCase):
+    def assert_matches_read_html(self, page: bytes, positions: tuple) -> None:
+        expected = pd.read_html(BytesIO(page), flavor="lxml")
+        got = _select_tables(page, positions)
+        self.assertEqual(len(got), len(positions))
+        for frame, i in zip(got, positions):
+            pd.testing.assert_frame_equal(frame, expected[i])
+
+    def test_hidden_table_is_not_counted(self):
+        # Six tables, the second hidden: read_html numbers them a, c, d, e, f.
+        page = (
+            "<html><body>"
+            + _table("a") + _table("b", "display: none") + _table("c")
+            + _table("d") + _table("e") + _table("f")
+            + "</body></html>"
+        ).encode()
+        self.assert_matches_read_html(page, (2, 4))
+        self.assertEqual(_select_tables(page, (2, 4))[0].iloc[0, 0], "d")
+
+    def test_hidden_rows_and_blank_tables(self):
+        page = (
+            "<html><body>"
+            + _table("a")
+            + '<table><tr style="display:none"><td>only hidden</td></tr></table>'
+            + '<table><tr><th>h</th></tr><tr style="display:none"><td>x</td></tr></table>'
+            + "<table><tr><td> </td></tr></table>"
+            + '<div style="display:none">' + _table("inside hidden div") + "</div>"
+            + _table("z")
+            + "</body></html>"
+        ).encode()
+        count = len(pd.read_html(BytesIO(page), flavor="lxml"))
+        self.assert_matches_read_html(page, tuple(range(count)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -125,8 +125,9 @@ def scrape_all_visa_info(url: str) -> dict[str, list[str]] | None:
         print(f"Error fetching the URL: {e}")
         return None
 
-    # Parse the HTML document.
-    soup = BeautifulSoup(response.text, "html.parser")
+    # Parse the HTML document from raw bytes; bs4 sniffs the declared charset,
+    # which avoids materializing a decoded copy of the page first.
+    soup = BeautifulSoup(response.content, "html.parser")
     visa_data: dict[str, list[str]] = {}
 
     # The site uses consistent classes on section headings; search for both variants.